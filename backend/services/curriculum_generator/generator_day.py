@@ -21,6 +21,7 @@ from .storage import (
 )
 from .llm_client import LLMClient
 from .prompts.kit_tasks import (
+    SerializedDict,
     task_day_fields,
     task_day_document,
     task_day_role_context,
@@ -379,8 +380,11 @@ def generate_day_fields(week: int, day: int, client: LLMClient) -> List[Path]:
                 fields_data["class_name"] = f"Week {week} Day {day}: Latin Foundations"
                 break
 
+    # Role context and guidelines both embed the full week spec; serialize it once
+    serialized_week_spec = SerializedDict(week_spec)
+
     # Generate role_context separately (field 04)
-    sys_rc, usr_rc, schema_rc = task_day_role_context(week_spec, day)
+    sys_rc, usr_rc, schema_rc = task_day_role_context(serialized_week_spec, day)
     response_rc = client.generate(prompt=usr_rc, system=sys_rc, json_schema=schema_rc)
 
     if response_rc.json:
@@ -400,7 +404,7 @@ def generate_day_fields(week: int, day: int, client: LLMClient) -> List[Path]:
             }
 
     # Generate guidelines (field 05) - needs role_context
-    sys_guide, usr_guide, _ = task_day_guidelines(week_spec, day, role_context_data)
+    sys_guide, usr_guide, _ = task_day_guidelines(serialized_week_spec, day, role_context_data)
     response_guide = client.generate(prompt=usr_guide, system=sys_guide)
     guidelines_content = response_guide.text
 
@@ -408,9 +412,9 @@ def generate_day_fields(week: int, day: int, client: LLMClient) -> List[Path]:
     class_name = fields_data.get("class_name", f"Week {week} Day {day}")
 
     # Load the day_summary prompt spec to get the schema
-    from .prompts.kit_tasks import _load_prompt_json
+    from .prompts.kit_tasks import _load_prompt_json, _spec_schema
     summary_prompt_spec = _load_prompt_json("day/day_summary.json")
-    summary_schema = summary_prompt_spec["output_contract"]["schema"]
+    summary_schema = _spec_schema(summary_prompt_spec)
 
     sys_summary, usr_summary, config_summary = task_day_summary(
         week_number=week,
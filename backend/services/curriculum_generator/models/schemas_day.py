@@ -1,11 +1,16 @@
 """Pydantic schemas for day-level curriculum structures."""
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Literal, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+from typing import Annotated, List, Literal, Optional, Dict, Any
 from datetime import datetime
 
+# Lesson step types that count as recall of prior knowledge in the opening steps
+_RECALL_TYPES = frozenset({"recall", "review", "greeting"})
+
 
 class DayMetadata(BaseModel):
     """Metadata for a single day's lesson."""
+    model_config = ConfigDict(frozen=True)
+
     course: Literal["Latin A"] = "Latin A"
     week: int = Field(..., ge=1, le=36, description="Week number")
     day: int = Field(..., ge=1, le=4, description="Day number within week")
@@ -17,6 +22,8 @@ class DayMetadata(BaseModel):
 
 class LessonStep(BaseModel):
     """Individual step in a lesson flow."""
+    model_config = ConfigDict(frozen=True)
+
     type: Literal[
         "recall", "introduction", "guided_practice",
         "independent_practice", "assessment", "transition",
@@ -25,13 +32,15 @@ class LessonStep(BaseModel):
         "copywork", "faith_reflection", "closure"
     ]
     duration_minutes: int = Field(..., ge=1, le=60, description="Step duration")
-    description: str = Field(..., min_length=10, description="What happens in this step")
-    student_action: str = Field(..., min_length=5, description="Expected student behavior")
+    description: Annotated[str, StringConstraints(min_length=10)] = Field(..., description="What happens in this step")
+    student_action: Annotated[str, StringConstraints(min_length=5)] = Field(..., description="Expected student behavior")
     teacher_notes: Optional[str] = Field(None, description="Notes for instructor")
 
 
 class BehaviorProfile(BaseModel):
     """Sparky's pedagogical behavior profile."""
+    model_config = ConfigDict(frozen=True)
+
     tone: str = Field(..., description="Teaching tone (encouraging, socratic, etc.)")
     loop_behavior: str = Field(..., description="How Sparky handles repetition")
     hints_max: int = Field(3, ge=1, le=5, description="Max hints before revealing answer")
@@ -41,12 +50,16 @@ class BehaviorProfile(BaseModel):
 
 class DayObjectives(BaseModel):
     """Learning objectives for a single day."""
+    model_config = ConfigDict(frozen=True)
+
     primary: List[str] = Field(..., min_items=1, description="Main learning goals")
     spiral_review: List[str] = Field(default_factory=list, description="Review goals from prior weeks")
 
 
 class DaySpiralLinks(BaseModel):
     """Day-specific spiral learning connections."""
+    model_config = ConfigDict(frozen=True)
+
     recycled_vocab: List[str] = Field(default_factory=list, description="Vocabulary from prior weeks")
     recycled_grammar: List[str] = Field(default_factory=list, description="Grammar from prior weeks")
     prior_day_concepts: List[str] = Field(default_factory=list, description="Concepts from previous day")
@@ -55,6 +68,8 @@ class DaySpiralLinks(BaseModel):
 
 class DayDocument(BaseModel):
     """Complete lesson plan document for a single day."""
+    model_config = ConfigDict(frozen=True)
+
     metadata: DayMetadata
     prior_knowledge_digest: str = Field(
         ...,
@@ -76,21 +91,42 @@ class DayDocument(BaseModel):
 
     @field_validator("lesson_flow")
     @classmethod
-    def validate_spiral_opening(cls, v):
-        """Ensure first 1-2 steps are recall/review."""
+    def validate_lesson_flow(cls, v, info):
+        """
+        Ensure first 1-2 steps are recall/review and Day 4 includes assessment.
+
+        Both rules are checked in a single pass over the lesson steps.
+        """
         if len(v) < 2:
             raise ValueError("Lesson flow must have at least 2 steps")
 
-        first_two_types = [step.type for step in v[:2]]
-        recall_types = {"recall", "review", "greeting"}
+        metadata = info.data.get("metadata")
+        has_assessment = getattr(metadata, "day", None) != 4
+        opens_with_recall = False
+
+        for index, step in enumerate(v):
+            if index < 2:
+                if step.type in _RECALL_TYPES:
+                    opens_with_recall = True
+            elif has_assessment:
+                break
+            if step.type == "assessment":
+                has_assessment = True
 
         # At least one of the first two steps should be recall/review
-        if not any(t in recall_types for t in first_two_types):
+        if not opens_with_recall:
+            first_two_types = [step.type for step in v[:2]]
             raise ValueError(
                 "First 1-2 lesson steps must include recall/review of prior knowledge. "
                 f"Found: {first_two_types}"
             )
 
+        if not has_assessment:
+            raise ValueError(
+                "Day 4 must include an 'assessment' step type. "
+                "This enforces spiral learning review."
+            )
+
         return v
 
     @field_validator("prior_knowledge_digest")
@@ -101,17 +137,3 @@ class DayDocument(BaseModel):
         if word_count < 30:
             raise ValueError(f"Prior knowledge digest too short: {word_count} words (need 30+)")
         return v
-
-    @field_validator("lesson_flow")
-    @classmethod
-    def validate_day4_assessment(cls, v, info):
-        """Day 4 must include assessment step."""
-        metadata = info.data.get("metadata")
-        if metadata and hasattr(metadata, "day") and metadata.day == 4:
-            has_assessment = any(step.type == "assessment" for step in v)
-            if not has_assessment:
-                raise ValueError(
-                    "Day 4 must include an 'assessment' step type. "
-                    "This enforces spiral learning review."
-                )
-        return v
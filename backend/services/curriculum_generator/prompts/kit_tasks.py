@@ -7,16 +7,129 @@ PROMPT ENGINEERING ARCHITECTURE (7-field day structure):
 - Repair logic and fallbacks for missing dependencies
 - Optimized for OpenAI GPT-4o
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Any, List
+from types import MappingProxyType
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Any, List, Union
 import json
+import os
+import re
 import orjson
 
+# Directory holding the JSON prompt specifications
+_PROMPTS_DIR = Path(__file__).parent
+
+# Shared read-only default for chained .get() lookups on nested research data,
+# so a missing section does not allocate a fresh dict. Not JSON-serializable,
+# so use a plain {} where the default itself is dumped into a prompt.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Stand-in value for week spec fields when no compiled week spec is supplied
+_LOAD_FROM_SPEC = "[Load from week spec]"
+
 
 # ============================================================================
 # WEEK SPEC DATA EXTRACTION HELPERS (v1.0 and v1.1 compatible)
 # ============================================================================
 
+def _extract_v11(week_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract week data from the v1.1 nested week_spec_kit structure."""
+    kit = week_spec["week_spec_kit"]
+    week_info = kit.get("week_info", {})
+    result = {
+        "metadata": {},
+        "objectives": [],
+        "vocabulary": [],
+        "grammar_focus": week_info.get("grammar_focus", ""),
+        "chant": week_info.get("chant", ""),
+        "virtue_focus": week_info.get("virtue_focus", ""),
+        "faith_phrase": week_info.get("faith_phrase", ""),
+        "week_number": week_info.get("week_number", 0),
+        "week_title": week_info.get("title", ""),
+    }
+
+    # Extract from generated_files array
+    for file_obj in kit.get("generated_files", []):
+        file_name = file_obj.get("file_name", "")
+        content = file_obj.get("content", {})
+
+        if file_name == "01_metadata.json":
+            result["metadata"] = content
+            if not result["week_number"]:
+                result["week_number"] = content.get("week_number", 0)
+            if not result["week_title"]:
+                result["week_title"] = content.get("week_title", "")
+            if not result["grammar_focus"]:
+                result["grammar_focus"] = content.get("grammar_focus", "")
+
+        elif file_name == "02_objectives.json":
+            result["objectives"] = content.get("objectives", [])
+
+        elif file_name == "03_vocabulary.json":
+            result["vocabulary"] = content.get("vocabulary", [])
+
+    return result
+
+
+def _extract_v10(week_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract week data from the v1.0 flat structure ("01_metadata.json" keys)."""
+    metadata = week_spec["01_metadata.json"]
+    get = metadata.get
+    return {
+        "metadata": metadata,
+        "objectives": week_spec.get("02_objectives.json", []),
+        "vocabulary": week_spec.get("03_vocabulary.json", []),
+        "grammar_focus": get("grammar_focus", ""),
+        "chant": get("chant", ""),
+        "virtue_focus": get("virtue_focus", ""),
+        "faith_phrase": get("faith_phrase", ""),
+        "week_number": get("week_number", 0),
+        "week_title": get("week_title", ""),
+    }
+
+
+def _extract_custom(week_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract week data from custom root-level formats (Week 1 style)."""
+    get = week_spec.get
+    metadata = get("metadata", {})
+    faith_integration = get("faith_integration", {})
+
+    if "virtue" in faith_integration:
+        virtue_focus = faith_integration["virtue"]
+    else:
+        virtue_focus = get("virtue_focus", "")
+    if "faith_phrase" in faith_integration:
+        faith_phrase = faith_integration["faith_phrase"]
+    else:
+        faith_phrase = get("faith_phrase", "")
+
+    vocabulary = []
+    vocabulary_data = get("vocabulary", {})
+    if isinstance(vocabulary_data, dict):
+        vocabulary = vocabulary_data.get("core_items", [])
+    elif isinstance(vocabulary_data, list):
+        vocabulary = vocabulary_data
+
+    objectives = []
+    objectives_data = get("objectives", {})
+    if isinstance(objectives_data, dict):
+        objectives = objectives_data.get("skill_goals", [])
+    elif isinstance(objectives_data, list):
+        objectives = objectives_data
+
+    return {
+        "metadata": metadata,
+        "objectives": objectives,
+        "vocabulary": vocabulary,
+        "grammar_focus": get("grammar_focus", ""),
+        "chant": get("chant", ""),
+        "virtue_focus": virtue_focus,
+        "faith_phrase": faith_phrase,
+        "week_number": metadata.get("week", 0),
+        "week_title": metadata.get("title", ""),
+    }
+
+
 def _extract_from_week_spec(week_spec: Dict[str, Any]) -> Dict[str, Any]:
     """
     Extract data from week_spec in a format-agnostic way.
@@ -26,112 +139,311 @@ def _extract_from_week_spec(week_spec: Dict[str, Any]) -> Dict[str, Any]:
     - v1.1 format: nested "week_spec_kit.generated_files" structure
     - Custom formats: root-level metadata/grammar_focus
 
+    The format is detected once and dispatched to a dedicated extractor.
+
     Returns:
         Dictionary with standardized keys: metadata, objectives, vocabulary,
         grammar_focus, chant, virtue_focus, faith_phrase, etc.
     """
-    result = {
-        "metadata": {},
-        "objectives": [],
-        "vocabulary": [],
-        "grammar_focus": "",
-        "chant": "",
-        "virtue_focus": "",
-        "faith_phrase": "",
-        "week_number": 0,
-        "week_title": "",
+    if "week_spec_kit" in week_spec:
+        return _extract_v11(week_spec)
+    if "01_metadata.json" in week_spec:
+        return _extract_v10(week_spec)
+    return _extract_custom(week_spec)
+
+
+def _extract_virtue_faith(week_spec: Mapping[str, Any]) -> Tuple[str, str]:
+    """
+    Return (virtue, faith_phrase) from a flat week spec for the QA prompts.
+
+    virtue_focus wins over the legacy "virtue" key; either falls back to "N/A".
+    The fallback lookup only runs when virtue_focus is absent.
+    """
+    virtue = week_spec["virtue_focus"] if "virtue_focus" in week_spec else week_spec.get("virtue", "N/A")
+    return virtue, week_spec.get("faith_phrase", "N/A")
+
+
+def _freeze(obj: Any) -> Any:
+    """
+    Recursively convert dicts to MappingProxyType and lists to tuples.
+
+    Frozen values still serialize with json.dumps(..., default=dict) and the
+    orjson-based _dumps_* helpers.
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+
+@lru_cache(maxsize=None)
+def _load_prompt_json(filename: str) -> Mapping[str, Any]:
+    """
+    Load a JSON prompt specification from the prompts directory.
+
+    Specs are parsed once per process and shared between callers, so they
+    must be treated as read-only. List-valued content_template entries are
+    joined with newlines here so task functions can use them directly, and
+    the placeholder names used by the templates are recorded under
+    "_placeholders" so tasks can skip preparing values nothing consumes.
+    The system and user templates are exposed directly as "_system" and
+    "_user_template", and the task configs are pre-built from
+    model_preferences as read-only mappings that every call can hand out
+    without copying.
+
+    The returned spec is frozen (see _freeze) so the shared instance cannot
+    be mutated by accident, e.g. from concurrent day-generation workers.
+    Use _spec_schema for a plain-dict copy of the output_contract schema.
+    """
+    prompt_spec = orjson.loads((_PROMPTS_DIR / filename).read_bytes())
+
+    placeholders = set()
+    for message in prompt_spec.get("messages", []):
+        content_template = message.get("content_template")
+        if isinstance(content_template, list):
+            content_template = message["content_template"] = "\n".join(content_template)
+        if isinstance(content_template, str):
+            placeholders.update(_PLACEHOLDER_RE.findall(content_template))
+    prompt_spec["_placeholders"] = frozenset(placeholders)
+
+    # System and user templates pre-extracted for the task functions
+    messages = prompt_spec.get("messages", [])
+    if len(messages) >= 2:
+        prompt_spec["_system"] = messages[0]["content_template"]
+        prompt_spec["_user_template"] = messages[1]["content_template"]
+
+    # Pre-build the model config returned by the task functions
+    model_preferences = prompt_spec.get("model_preferences")
+    if model_preferences:
+        config = {
+            "temperature": model_preferences["temperature"],
+            "max_tokens": model_preferences["max_tokens"]
+        }
+        prompt_spec["_config"] = MappingProxyType(config)
+        prompt_spec["_config_with_model"] = MappingProxyType(dict(config, model=model_preferences["model"]))
+
+    return _freeze(prompt_spec)
+
+
+def _spec_config(prompt_spec: Mapping[str, Any], include_model: bool = False) -> Mapping[str, Any]:
+    """
+    Return the model config pre-built by _load_prompt_json.
+
+    The same read-only mapping is shared by every call for a spec; callers
+    that need to adjust it should take a dict() copy.
+    """
+    return prompt_spec["_config_with_model" if include_model else "_config"]
+
+
+def _thaw(obj: Any) -> Dict[str, Any]:
+    """orjson default hook: serialize frozen spec mappings as plain dicts."""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _spec_schema(prompt_spec: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Return a plain-dict copy of the spec's output_contract schema.
+
+    The LLM client needs a dict for structured output; each caller gets its
+    own copy so the cached spec stays read-only.
+    """
+    return orjson.loads(orjson.dumps(prompt_spec["output_contract"]["schema"], default=_thaw))
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """
+    Serialize obj as 2-space indented JSON for embedding in prompts.
+
+    Drop-in for json.dumps(obj, indent=2): non-string keys are coerced to
+    strings the same way, but non-ASCII text is emitted as UTF-8.
+    """
+    return orjson.dumps(obj, default=_thaw, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _dumps_compact(obj: Any) -> str:
+    """
+    Serialize obj as compact JSON (no whitespace) for embedding in prompts.
+
+    Used where the JSON is only model input: the model reads it just as well
+    without indentation, and it is roughly a third fewer characters/tokens.
+    Keys are sorted so equal dicts built in a different insertion order
+    render identically, keeping prompt prefixes stable across calls.
+    """
+    return orjson.dumps(obj, default=_thaw, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS).decode()
+
+
+class SerializedDict(Mapping):
+    """
+    Read-only view of a dict that serializes it to compact JSON at most once.
+
+    Wrap a week spec (or any other large dict) before passing it to several
+    day-level tasks in a row; each task embeds the same cached string instead
+    of re-running json.dumps. The wrapped dict must not be mutated afterwards.
+    """
+
+    __slots__ = ("_data", "_json")
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+        self._json: Optional[str] = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def to_json(self) -> str:
+        """Return the compact JSON for the wrapped dict, serializing on first use."""
+        if self._json is None:
+            self._json = _dumps_compact(self._data)
+        return self._json
+
+
+# Set TEQUILA_PROMPT_PRETTY=true to embed QA/export payloads indented, e.g.
+# when reading prompts by hand; by default they are compact (fewer tokens)
+_PROMPT_PRETTY = os.getenv("TEQUILA_PROMPT_PRETTY", "false").lower() == "true"
+
+
+def _dumps_payload(obj: Any) -> str:
+    """Serialize a QA/export payload: compact, or indented if _PROMPT_PRETTY."""
+    return _dumps_pretty(obj) if _PROMPT_PRETTY else _dumps_compact(obj)
+
+
+def _maybe_dumps(obj: Any) -> str:
+    """_dumps_payload(obj), passing through payloads the caller already serialized."""
+    return obj if isinstance(obj, str) else _dumps_payload(obj)
+
+
+def _to_json(obj: Any) -> str:
+    """Compact JSON for obj, reusing the cached string of a SerializedDict."""
+    if isinstance(obj, SerializedDict):
+        return obj.to_json()
+    return _dumps_compact(obj)
+
+
+# Appended to JSON excerpts cut short to save prompt tokens
+_TRUNCATED_MARKER = "\n... (truncated)"
+
+
+def _dumps_truncated(obj: Any, max_chars: int) -> str:
+    """Compact JSON for obj (see _to_json), cut to max_chars with a truncation marker."""
+    text = _to_json(obj)
+    return text[:max_chars] + _TRUNCATED_MARKER if len(text) > max_chars else text
+
+
+def _role_context_excerpt(role_context: Mapping[str, Any]) -> Dict[str, Any]:
+    """Identity, audience and constraints only, for prompts that need brevity."""
+    return {
+        "identity": role_context.get("identity", "Sparky the Encourager"),
+        "audience": role_context.get("audience", "Grade 3 (Grammar Stage, U.S.)"),
+        "constraints": role_context.get("constraints", {})
     }
 
-    # v1.1 structure: week_spec_kit
-    if "week_spec_kit" in week_spec:
-        week_info = week_spec["week_spec_kit"].get("week_info", {})
-        result["week_number"] = week_info.get("week_number", 0)
-        result["week_title"] = week_info.get("title", "")
-        result["grammar_focus"] = week_info.get("grammar_focus", "")
-        result["chant"] = week_info.get("chant", "")
-        result["virtue_focus"] = week_info.get("virtue_focus", "")
-        result["faith_phrase"] = week_info.get("faith_phrase", "")
-
-        # Extract from generated_files array
-        generated_files = week_spec["week_spec_kit"].get("generated_files", [])
-        for file_obj in generated_files:
-            file_name = file_obj.get("file_name", "")
-            content = file_obj.get("content", {})
-
-            if file_name == "01_metadata.json":
-                result["metadata"] = content
-                if not result["week_number"]:
-                    result["week_number"] = content.get("week_number", 0)
-                if not result["week_title"]:
-                    result["week_title"] = content.get("week_title", "")
-                if not result["grammar_focus"]:
-                    result["grammar_focus"] = content.get("grammar_focus", "")
-
-            elif file_name == "02_objectives.json":
-                result["objectives"] = content.get("objectives", [])
-
-            elif file_name == "03_vocabulary.json":
-                result["vocabulary"] = content.get("vocabulary", [])
-
-    # v1.0 structure: flat keys
-    elif "01_metadata.json" in week_spec:
-        metadata = week_spec.get("01_metadata.json", {})
-        result["metadata"] = metadata
-        result["week_number"] = metadata.get("week_number", 0)
-        result["week_title"] = metadata.get("week_title", "")
-        result["grammar_focus"] = metadata.get("grammar_focus", "")
-        result["chant"] = metadata.get("chant", "")
-        result["virtue_focus"] = metadata.get("virtue_focus", "")
-        result["faith_phrase"] = metadata.get("faith_phrase", "")
-        result["objectives"] = week_spec.get("02_objectives.json", [])
-        result["vocabulary"] = week_spec.get("03_vocabulary.json", [])
-
-    # Custom format: root-level keys (Week 1 style)
-    else:
-        metadata = week_spec.get("metadata", {})
-        result["metadata"] = metadata
-        result["week_number"] = metadata.get("week", 0)
-        result["week_title"] = metadata.get("title", "")
-        result["grammar_focus"] = week_spec.get("grammar_focus", "")
-        result["chant"] = week_spec.get("chant", "")
-
-        faith_integration = week_spec.get("faith_integration", {})
-        result["virtue_focus"] = faith_integration.get("virtue", week_spec.get("virtue_focus", ""))
-        result["faith_phrase"] = faith_integration.get("faith_phrase", week_spec.get("faith_phrase", ""))
-
-        vocabulary_data = week_spec.get("vocabulary", {})
-        if isinstance(vocabulary_data, dict):
-            result["vocabulary"] = vocabulary_data.get("core_items", [])
-        elif isinstance(vocabulary_data, list):
-            result["vocabulary"] = vocabulary_data
-
-        objectives = week_spec.get("objectives", {})
-        if isinstance(objectives, dict):
-            result["objectives"] = objectives.get("skill_goals", [])
-        elif isinstance(objectives, list):
-            result["objectives"] = objectives
 
-    return result
+def prepare_role_context_variants(role_context: Mapping[str, Any]) -> Dict[str, str]:
+    """
+    Serialize a day's role context once for every task that embeds it.
 
+    Returns the "full" JSON (task_guidelines), the 1500-char "truncated"
+    excerpt (task_document_day) and the "pruned" identity excerpt
+    (task_greeting). Pass the result as role_context_serialized to skip
+    the per-task dumps.
+    """
+    full = _to_json(role_context)
+    return {
+        "full": full,
+        "truncated": full[:1500] + _TRUNCATED_MARKER if len(full) > 1500 else full,
+        "pruned": _dumps_compact(_role_context_excerpt(role_context))
+    }
+
+
+# Matches {{placeholder}} markers in prompt templates, including dotted paths
+# such as {{contracts.pedagogical_rules.lesson_total_minutes_min}} and
+# expressions such as {{day_intent[day_number]}} or {{current_week_number - 1}}
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*([\w.\[\] -]+?)\s*\}\}")
+
+
+class _KeepMissing(dict):
+    """format_map mapping that leaves unknown placeholders as {{name}} markers."""
+
+    def __missing__(self, key: str) -> str:
+        return "{{" + key + "}}"
 
-def _load_system_prompt(filename: str) -> str:
-    """Load a system prompt from the prompts directory."""
-    path = Path(__file__).parent / filename
-    return path.read_text(encoding="utf-8")
+
+@lru_cache(maxsize=None)
+def _format_template(template: str) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Compile {{placeholder}} markers into a str.format_map template.
+
+    Literal braces (embedded JSON examples) are escaped so they survive
+    formatting. Placeholder names that are not plain identifiers (dotted
+    paths, expressions), which str.format would treat as attribute/index
+    access, get a generated field name instead; the returned aliases map
+    each generated field back to its placeholder name.
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    aliases: Dict[str, str] = {}
+    # split() alternates literal text and captured placeholder names
+    for index in range(0, len(parts), 2):
+        parts[index] = parts[index].replace("{", "{{").replace("}", "}}")
+    for index in range(1, len(parts), 2):
+        name = parts[index]
+        if not name.isidentifier():
+            name = aliases.setdefault(name, f"_placeholder_{len(aliases)}")
+        parts[index] = "{" + name + "}"
+    return "".join(parts), tuple((field, name) for name, field in aliases.items())
 
 
-def _load_prompt_json(filename: str) -> Dict[str, Any]:
-    """Load a JSON prompt specification from the prompts directory."""
-    path = Path(__file__).parent / filename
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+def _render_template(template: str, values: Dict[str, str]) -> str:
+    """
+    Substitute all {{placeholder}} markers in a single pass over the template.
+
+    The template is compiled once into a str.format_map template, so each
+    call is a single C-level formatting pass. Placeholders without an entry
+    in values are left untouched so they can still be resolved downstream
+    (file/API references).
+    """
+    if "{{" not in template:
+        return template
+    format_template, aliases = _format_template(template)
+    mapping = _KeepMissing(values)
+    for field, name in aliases:
+        mapping[field] = values.get(name, "{{" + name + "}}")
+    return format_template.format_map(mapping)
+
+
+def _run_task(
+    prompt_spec: Mapping[str, Any],
+    values: Dict[str, str],
+    system_values: Optional[Dict[str, str]] = None
+) -> Tuple[str, str, Mapping[str, Any]]:
+    """
+    Shared tail of the spec-driven tasks: render both messages, attach config.
+
+    The config is the spec's shared read-only mapping (see _spec_config).
+
+    The system message is rendered only when system_values is given; most
+    system prompts carry no placeholders and are returned as loaded.
+    """
+    system_content = prompt_spec["_system"]
+    if system_values:
+        system_content = _render_template(system_content, system_values)
+    user_content = _render_template(prompt_spec["_user_template"], values)
+    return (system_content, user_content, _spec_config(prompt_spec, include_model=True))
 
 
 # ============================================================================
 # SYSTEM OVERVIEW PROMPT - Establishes TEQUILA/Steel architecture
 # ============================================================================
 
-def task_system_overview() -> Tuple[str, str, Dict[str, Any]]:
+def task_system_overview() -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate TEQUILA system overview manifesto.
 
@@ -144,7 +456,7 @@ def task_system_overview() -> Tuple[str, str, Dict[str, Any]]:
     - Budget, provenance, and validation policies
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         Markdown document (~1000 words) saved to docs/SYSTEM_OVERVIEW.md
@@ -161,22 +473,45 @@ def task_system_overview() -> Tuple[str, str, Dict[str, Any]]:
     seven_fields = ", ".join(prompt_spec["inputs"]["seven_field_names"])
 
     # Build user prompt from template
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{latin_a_outline}}", outline)
-    user_content = user_content.replace("{{pedagogical_pillars}}", pillars)
-    user_content = user_content.replace("{{seven_field_names}}", seven_fields)
+    user_content = _render_template(
+        prompt_spec["_user_template"],
+        {
+            "latin_a_outline": outline,
+            "pedagogical_pillars": pillars,
+            "seven_field_names": seven_fields
+        }
+    )
 
-    system_content = prompt_spec["messages"][0]["content_template"]
+    system_content = prompt_spec["_system"]
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"]
-    }
+    config = _spec_config(prompt_spec)
 
     return (system_content, user_content, config)
 
 
-def task_project_manifest() -> Tuple[str, str, Dict[str, Any]]:
+@lru_cache(maxsize=1)
+def _latin_a_outline() -> str:
+    """
+    Return the Latin A course outline formatted as a numbered list.
+
+    Read once from system_overview.json (or the embedded fallback) so the
+    manifest prompt does not depend on that spec on every call.
+    """
+    try:
+        system_overview_spec = _load_prompt_json("system/system_overview.json")
+        latin_a_outline = system_overview_spec["inputs"]["latin_a_outline"]
+    except (FileNotFoundError, KeyError):
+        # Fallback: use outline from this spec (if embedded)
+        latin_a_outline = [
+            "1. Introduction to Latin & Pronunciation (Ecclesiastical & Classical)",
+            "2. First Declension Nouns (Singular)",
+            # ... (would be full list in production)
+        ]
+
+    return "\n".join(latin_a_outline)
+
+
+def task_project_manifest() -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate TEQUILA project manifest for all 35 weeks.
 
@@ -188,38 +523,22 @@ def task_project_manifest() -> Tuple[str, str, Dict[str, Any]]:
     - Open-source policy and originality requirements
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON manifest saved to data/project_manifest.json
     """
     prompt_spec = _load_prompt_json("system/project_manifest.json")
 
-    # Get latin_a_outline from system_overview (or use embedded version)
-    try:
-        system_overview_spec = _load_prompt_json("system/system_overview.json")
-        latin_a_outline = system_overview_spec["inputs"]["latin_a_outline"]
-    except (FileNotFoundError, KeyError):
-        # Fallback: use outline from this spec (if embedded)
-        latin_a_outline = [
-            "1. Introduction to Latin & Pronunciation (Ecclesiastical & Classical)",
-            "2. First Declension Nouns (Singular)",
-            # ... (would be full list in production)
-        ]
-
-    # Format outline as numbered list
-    outline_text = "\n".join(latin_a_outline)
-
     # Build user prompt from template
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{latin_a_outline}}", outline_text)
+    user_content = _render_template(
+        prompt_spec["_user_template"],
+        {"latin_a_outline": _latin_a_outline()}
+    )
 
-    system_content = prompt_spec["messages"][0]["content_template"]
+    system_content = prompt_spec["_system"]
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"]
-    }
+    config = _spec_config(prompt_spec)
 
     return (system_content, user_content, config)
 
@@ -228,11 +547,48 @@ def task_project_manifest() -> Tuple[str, str, Dict[str, Any]]:
 # SCHEMA VALIDATION PROMPT - Validates entire week structure
 # ============================================================================
 
+@lru_cache(maxsize=256)
+def _schema_validation_user_content(week_number: int, project_root: str) -> str:
+    """Render the schema validation user prompt, which depends only on week and root."""
+    prompt_spec = _load_prompt_json("validation/schema_validation.json")
+
+    # Interpolate pedagogical rules
+    contracts = prompt_spec["inputs"]["contracts"]
+    ped_rules = contracts["pedagogical_rules"]
+    orig_rules = contracts["originality_rules"]
+    grade_rules = contracts["grade_level_rules"]
+
+    # Build user prompt with interpolated values
+    return _render_template(
+        prompt_spec["_user_template"],
+        {
+            "project_root": project_root,
+            "week_number": str(week_number),
+            "contracts.pedagogical_rules.lesson_total_minutes_min":
+                str(ped_rules["lesson_total_minutes_min"]),
+            "contracts.pedagogical_rules.lesson_total_minutes_max":
+                str(ped_rules["lesson_total_minutes_max"]),
+            "contracts.originality_rules.n_gram_window":
+                str(orig_rules["n_gram_window"]),
+            "contracts.originality_rules.n_gram_similarity_max":
+                str(orig_rules["n_gram_similarity_max"]),
+            "contracts.originality_rules.example_overlap_max_pct":
+                str(orig_rules["example_overlap_max_pct"]),
+            "contracts.grade_level_rules.english_exposition_target_flesch_kincaid_max":
+                str(grade_rules["english_exposition_target_flesch_kincaid_max"]),
+            "contracts.grade_level_rules.english_sentence_length_max":
+                str(grade_rules["english_sentence_length_max"]),
+            "contracts.grade_level_rules.latin_sentence_length_max_words":
+                str(grade_rules["latin_sentence_length_max_words"])
+        }
+    )
+
+
 def task_schema_validation(
     week_number: int,
     project_root: str = "curriculum/LatinA",
     week_files: Optional[Dict[str, Any]] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate validation report for a complete week.
 
@@ -253,69 +609,26 @@ def task_schema_validation(
         week_files: Optional dict of file contents (if not provided, assumes FS binding)
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON validation report saved to validation_reports/Week{week_number}_validation.json
     """
     prompt_spec = _load_prompt_json("validation/schema_validation.json")
-
-    # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_root}}", project_root)
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-
-    # Interpolate pedagogical rules
-    contracts = prompt_spec["inputs"]["contracts"]
-    ped_rules = contracts["pedagogical_rules"]
-    orig_rules = contracts["originality_rules"]
-    grade_rules = contracts["grade_level_rules"]
-
-    user_content = user_content.replace(
-        "{{contracts.pedagogical_rules.lesson_total_minutes_min}}",
-        str(ped_rules["lesson_total_minutes_min"])
-    )
-    user_content = user_content.replace(
-        "{{contracts.pedagogical_rules.lesson_total_minutes_max}}",
-        str(ped_rules["lesson_total_minutes_max"])
-    )
-    user_content = user_content.replace(
-        "{{contracts.originality_rules.n_gram_window}}",
-        str(orig_rules["n_gram_window"])
-    )
-    user_content = user_content.replace(
-        "{{contracts.originality_rules.n_gram_similarity_max}}",
-        str(orig_rules["n_gram_similarity_max"])
-    )
-    user_content = user_content.replace(
-        "{{contracts.originality_rules.example_overlap_max_pct}}",
-        str(orig_rules["example_overlap_max_pct"])
-    )
-    user_content = user_content.replace(
-        "{{contracts.grade_level_rules.english_exposition_target_flesch_kincaid_max}}",
-        str(grade_rules["english_exposition_target_flesch_kincaid_max"])
-    )
-    user_content = user_content.replace(
-        "{{contracts.grade_level_rules.english_sentence_length_max}}",
-        str(grade_rules["english_sentence_length_max"])
-    )
-    user_content = user_content.replace(
-        "{{contracts.grade_level_rules.latin_sentence_length_max_words}}",
-        str(grade_rules["latin_sentence_length_max_words"])
-    )
+    user_content = _schema_validation_user_content(week_number, project_root)
 
     # If week_files provided, append them to the prompt
     if week_files:
-        user_content += "\n\n## Provided File Contents\n"
-        for path, content in week_files.items():
-            user_content += f"\n### {path}\n```\n{content}\n```\n"
+        parts = [user_content, "\n\n## Provided File Contents\n"]
+        parts.extend(
+            f"\n### {path}\n```\n{content}\n```\n"
+            for path, content in week_files.items()
+        )
+        user_content = "".join(parts)
 
-    system_content = prompt_spec["messages"][0]["content_template"]
+    system_content = prompt_spec["_system"]
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"]
-    }
+    config = _spec_config(prompt_spec)
 
     return (system_content, user_content, config)
 
@@ -324,11 +637,56 @@ def task_schema_validation(
 # WEEK VALIDATION PROMPT - Final readiness gate for week publication
 # ============================================================================
 
+@lru_cache(maxsize=256)
+def _build_week_paths(project_root: str, week_number: int) -> Tuple[str, str, str]:
+    """
+    Build the week spec, prior knowledge digest, and manifest paths for a week.
+
+    ":02d" already zero-pads single-digit weeks and leaves 10+ unchanged, so
+    no separate branch is needed for two-digit week numbers.
+    """
+    week_str = f"Week{week_number:02d}"
+    return (
+        f"{project_root}/{week_str}/Week_Spec/99_compiled_week_spec.json",
+        f"{project_root}/{week_str}/Week_Spec/07_prior_knowledge_digest.json",
+        f"{project_root}/project_manifest.json"
+    )
+
+
+@lru_cache(maxsize=256)
+def _week_validation_user_content(week_number: int, project_root: str) -> str:
+    """Render the week validation user prompt, which depends only on week and root."""
+    prompt_spec = _load_prompt_json("validation/week_validation.json")
+
+    compiled_week_spec_path, prior_knowledge_digest_path, project_manifest_path = (
+        _build_week_paths(project_root, week_number)
+    )
+
+    # Build user prompt with interpolated paths and policy thresholds
+    thresholds = prompt_spec["inputs"]["policy_thresholds"]
+    return _render_template(
+        prompt_spec["_user_template"],
+        {
+            "project_root": project_root,
+            "week_number": str(week_number),
+            "compiled_week_spec_path": compiled_week_spec_path,
+            "prior_knowledge_digest_path": prior_knowledge_digest_path,
+            "project_manifest_path": project_manifest_path,
+            "policy_thresholds.min_vocab_new": str(thresholds["min_vocab_new"]),
+            "policy_thresholds.max_vocab_new": str(thresholds["max_vocab_new"]),
+            "policy_thresholds.min_quiz_items": str(thresholds["min_quiz_items"]),
+            "policy_thresholds.lesson_minutes_min": str(thresholds["lesson_minutes_min"]),
+            "policy_thresholds.lesson_minutes_max": str(thresholds["lesson_minutes_max"]),
+            "policy_thresholds.license_allowed": str(list(thresholds["license_allowed"]))
+        }
+    )
+
+
 def task_week_validation(
     week_number: int,
     project_root: str = "curriculum/LatinA",
     schema_report: Optional[Dict[str, Any]] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate final week validation report - publishability gate.
 
@@ -366,83 +724,270 @@ def task_week_validation(
         schema_report: Optional schema validation report from prompt_for_schema_validation
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON validation report with gate status and fix patches
     """
     prompt_spec = _load_prompt_json("validation/week_validation.json")
+    user_content = _week_validation_user_content(week_number, project_root)
 
-    # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_root}}", project_root)
-    user_content = user_content.replace("{{week_number}}", str(week_number))
+    # schema_report is referenced by the prompt spec but not templated, so it
+    # is left for file/API reference rather than serialized here
+
+    system_content = prompt_spec["_system"]
 
-    # Build file paths with zero-padded week number
-    week_str = f"Week{week_number:02d}" if week_number < 10 else f"Week{week_number}"
+    config = _spec_config(prompt_spec)
 
-    compiled_week_spec_path = f"{project_root}/{week_str}/Week_Spec/99_compiled_week_spec.json"
-    prior_knowledge_digest_path = f"{project_root}/{week_str}/Week_Spec/07_prior_knowledge_digest.json"
-    project_manifest_path = f"{project_root}/project_manifest.json"
+    return (system_content, user_content, config)
 
-    user_content = user_content.replace("{{compiled_week_spec_path}}", compiled_week_spec_path)
-    user_content = user_content.replace("{{prior_knowledge_digest_path}}", prior_knowledge_digest_path)
-    user_content = user_content.replace("{{project_manifest_path}}", project_manifest_path)
 
-    # Replace policy thresholds
-    thresholds = prompt_spec["inputs"]["policy_thresholds"]
-    user_content = user_content.replace(
-        "{{policy_thresholds.min_vocab_new}}",
-        str(thresholds["min_vocab_new"])
-    )
-    user_content = user_content.replace(
-        "{{policy_thresholds.max_vocab_new}}",
-        str(thresholds["max_vocab_new"])
-    )
-    user_content = user_content.replace(
-        "{{policy_thresholds.min_quiz_items}}",
-        str(thresholds["min_quiz_items"])
-    )
-    user_content = user_content.replace(
-        "{{policy_thresholds.lesson_minutes_min}}",
-        str(thresholds["lesson_minutes_min"])
-    )
-    user_content = user_content.replace(
-        "{{policy_thresholds.lesson_minutes_max}}",
-        str(thresholds["lesson_minutes_max"])
-    )
-    user_content = user_content.replace(
-        "{{policy_thresholds.license_allowed}}",
-        str(thresholds["license_allowed"])
-    )
+# ============================================================================
+# WEEK SPEC PROMPT - Generates complete 12-file week specification
+# ============================================================================
 
-    # If schema_report provided, serialize it
-    # Otherwise leave as placeholder for file/API reference
-    if schema_report:
-        schema_json = json.dumps(schema_report, indent=2)
-        # Note: In the prompt spec, schema_report is referenced but not templated
-        # We could add it to the context if needed
-        pass
+# Fields kept when embedding research plan records in the week spec prompt
+_NEW_WORD_KEYS = ("word", "english", "rationale")
+_RECYCLED_WORD_KEYS = ("word", "originally_taught_week")
+_QUIZ_COMPONENT_KEYS = ("component", "format")
 
-    system_content = prompt_spec["messages"][0]["content_template"]
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"]
-    }
+def _trunc(text: str, limit: int) -> str:
+    """Cap text at limit characters, marking cut text with a trailing '...'."""
+    return text if len(text) <= limit else text[:limit] + "..."
 
-    return (system_content, user_content, config)
 
+def _project(items: List[Dict[str, Any]], keys: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """Keep only the given keys of each record, defaulting missing ones to ''."""
+    return [{key: item.get(key, '') for key in keys} for item in items]
+
+
+# PHASE 0 research block appended to the week spec user prompt. Each section is
+# filled with str.format and only emitted when its research output has data,
+# so the fragments must not contain literal braces.
+_RESEARCH_INJECTION_HEADER = """
+
+## PHASE 0 RESEARCH FINDINGS - USE ALL OF THIS DATA
+
+You have access to comprehensive pedagogical research conducted before generation.
+ALL of these findings MUST inform your week spec generation:
+
+"""
+
+_RESEARCH_VOCABULARY_SECTION = """### {number}. VERIFIED VOCABULARY (MUST USE EXACTLY)
+New Latin Words (verified by reasoning model):
+{vocab_new_json}
+
+Recycled Words (for spiral review):
+{vocab_recycled_json}
+
+Alignment Check: {alignment_check_json}
+
+CRITICAL: Use ONLY these words in 03_vocabulary.json. Do NOT generate different vocabulary.
+
+"""
+
+_RESEARCH_PRIOR_KNOWLEDGE_SECTION = """### {number}. PRIOR KNOWLEDGE (for 07_prior_knowledge_digest.json)
+Students entering this week already know:
+- Vocabulary: {prior_vocab_json}
+- Grammar Concepts: {prior_grammar_json}
+- Student State: {student_state}
+- Spiral Target: {spiral_target_pct}% prior content
+
+"""
+
+_RESEARCH_PEDAGOGY_SECTION = """### {number}. PEDAGOGICAL APPROACH (for 04_grammar_focus.md and 10_teacher_notes.md)
+How classical curricula teach this topic:
+- Logos Latin Approach: {logos_latin_approach}
+- Time-Tested Chants: {chants_json}
+- Common Misconceptions: {misconceptions_json}
+
+"""
+
+_RESEARCH_TIMING_SECTION = """### {number}. SESSION TIMING (for daily structure)
+- Recommended Duration: {duration_minutes} minutes
+- Time Breakdown: {time_breakdown_json}
+
+"""
+
+_RESEARCH_VIRTUE_SECTION = """### {number}. VIRTUE & FAITH INTEGRATION (for 05_virtue_focus.md and 06_faith_phrase.md)
+- Virtue: {virtue_focus}
+- Connection to Learning: {virtue_connection}
+- Scripture: {scripture_passage} - "{scripture_text}"
+- Faith Phrase: {faith_phrase}
+- Explanation: {faith_phrase_explanation}
+
+"""
+
+_RESEARCH_ASSESSMENT_SECTION = """### {number}. ASSESSMENT DESIGN (for 09_assessment_overview.json)
+Day 4 Quiz Components:
+{quiz_components_json}
+
+"""
+
+_RESEARCH_DIFFERENTIATION_SECTION = """### {number}. DIFFERENTIATION (for 10_teacher_notes.md)
+- Struggling Students: {struggling_json}
+- Advanced Students: {advanced_json}
+
+"""
+
+_RESEARCH_MATERIALS_SECTION = """### {number}. MATERIALS NEEDED (for 10_teacher_notes.md)
+- Chant Charts: {chant_charts_json}
+- Flashcard Sets: {flashcard_sets_json}
+
+"""
+
+_RESEARCH_STYLE_SECTION = """### {number}. STYLE GUIDE (from gold standard Week 1 & Week 11)
+Class Name Pattern: {class_name_pattern}
+Summary Style: {summary_style_json}
+Vocabulary Format: {vocabulary_format_json}
+
+"""
+
+_RESEARCH_ALIGNMENT_SECTION = """### {number}. ALIGNMENT GUIDANCE (how to combine research with style)
+{alignment_json}
+
+"""
+
+_RESEARCH_INJECTION_FOOTER = """---
+
+GENERATION INSTRUCTIONS:
+"""
+
+
+def _build_research_injection(research_plan: Dict[str, Any]) -> str:
+    """
+    Render the PHASE 0 research block from a research plan.
+
+    Sections whose research output is missing or empty are omitted, so
+    sparse plans do not inject scaffolding filled with blank values. The
+    emitted sections are numbered consecutively and the closing
+    instructions only refer to sections that are present; a plan with no
+    usable research renders nothing.
+    """
+    get = research_plan.get
+    dumps = _dumps_pretty
+    sections: List[str] = []
+    instructions: List[str] = []
+    style_sections: List[int] = []
+
+    def add_section(template: str, instruction: Optional[str] = None, **fields: Any) -> int:
+        number = len(sections) + 1
+        sections.append(template.format(number=number, **fields))
+        if instruction:
+            instructions.append(instruction.format(section=number))
+        return number
+
+    vocab_plan = get("04_vocabulary_plan")
+    if vocab_plan:
+        add_section(
+            _RESEARCH_VOCABULARY_SECTION,
+            "Use ONLY the verified vocabulary from section {section}",
+            vocab_new_json=dumps(_project(vocab_plan.get('new_latin_words', []), _NEW_WORD_KEYS)),
+            vocab_recycled_json=dumps(_project(vocab_plan.get('recycled_latin_words', []), _RECYCLED_WORD_KEYS)),
+            alignment_check_json=dumps(vocab_plan.get('alignment_check', {}))
+        )
+
+    backward = get("01_backward_analysis")
+    if backward:
+        add_section(
+            _RESEARCH_PRIOR_KNOWLEDGE_SECTION,
+            "Include spiral review from section {section} in 07_prior_knowledge_digest.json",
+            prior_vocab_json=dumps([v.get('word', '') for v in backward.get('cumulative_latin_vocabulary', [])[:10]]),
+            prior_grammar_json=dumps([c.get('concept', '') for c in backward.get('cumulative_grammar_concepts', [])[:5]]),
+            student_state=backward.get('student_knowledge_state', ''),
+            spiral_target_pct=backward.get('spiral_review_target_percentage', 0.25)*100
+        )
+
+    pedagogy = get("03_pedagogical_research")
+    if pedagogy:
+        add_section(
+            _RESEARCH_PEDAGOGY_SECTION,
+            "Use pedagogical approach from section {section} in grammar explanations",
+            logos_latin_approach=_trunc(pedagogy.get('logos_latin_approach', ''), 200),
+            chants_json=dumps(pedagogy.get('time_tested_chants', [])),
+            misconceptions_json=dumps(pedagogy.get('common_misconceptions', []))
+        )
+
+    duration = get("05_session_duration")
+    if duration:
+        add_section(
+            _RESEARCH_TIMING_SECTION,
+            "Use timing from section {section} to structure daily activities",
+            duration_minutes=duration.get('recommended_duration_minutes', 15),
+            time_breakdown_json=dumps(duration.get('time_breakdown', {}))
+        )
+
+    virtue = get("06_virtue_faith_strategy")
+    if virtue:
+        scripture = virtue.get('scripture_reference', _EMPTY)
+        add_section(
+            _RESEARCH_VIRTUE_SECTION,
+            "Use virtue/faith from section {section} in 05_virtue_focus.md and 06_faith_phrase.md",
+            virtue_focus=virtue.get('virtue_focus', ''),
+            virtue_connection=_trunc(virtue.get('virtue_connection_to_language_learning', ''), 150),
+            scripture_passage=scripture.get('passage', ''),
+            scripture_text=_trunc(scripture.get('text', ''), 100),
+            faith_phrase=virtue.get('faith_phrase', ''),
+            faith_phrase_explanation=_trunc(virtue.get('faith_phrase_explanation', ''), 150)
+        )
+
+    assessment = get("07_assessment_plan")
+    if assessment:
+        add_section(
+            _RESEARCH_ASSESSMENT_SECTION,
+            "Use assessment design from section {section} in 09_assessment_overview.json",
+            quiz_components_json=dumps(_project(assessment.get('day_4_quiz_components', []), _QUIZ_COMPONENT_KEYS))
+        )
+
+    differentiation = get("08_differentiation_plan")
+    if differentiation:
+        add_section(
+            _RESEARCH_DIFFERENTIATION_SECTION,
+            "Use differentiation from section {section} in 10_teacher_notes.md",
+            struggling_json=dumps(differentiation.get('struggling_students', _EMPTY).get('scaffolds', [])[:3]),
+            advanced_json=dumps(differentiation.get('advanced_students', _EMPTY).get('extensions', [])[:3])
+        )
+
+    materials = get("09_materials_list")
+    if materials:
+        add_section(
+            _RESEARCH_MATERIALS_SECTION,
+            chant_charts_json=dumps([c.get('title', '') for c in materials.get('chant_charts', [])]),
+            flashcard_sets_json=dumps([s.get('set_name', '') for s in materials.get('flashcard_sets', [])])
+        )
+
+    masters = get("10_master_analysis")
+    if masters:
+        style_sections.append(add_section(
+            _RESEARCH_STYLE_SECTION,
+            class_name_pattern=masters.get('class_name_pattern', ''),
+            summary_style_json=dumps(masters.get('summary_style_guide', {})),
+            vocabulary_format_json=dumps(masters.get('vocabulary_format', {}))
+        ))
+
+    alignment = get("11_alignment_guide")
+    if alignment:
+        style_sections.append(add_section(_RESEARCH_ALIGNMENT_SECTION, alignment_json=dumps(alignment)))
+
+    if not sections:
+        return ""
+
+    # Style guide and alignment guidance share one instruction
+    if len(style_sections) == 2:
+        instructions.append("Match style patterns from sections %d & %d" % tuple(style_sections))
+    elif style_sections:
+        instructions.append("Match style patterns from section %d" % style_sections[0])
+
+    footer = "".join("%d. %s\n" % (index, text) for index, text in enumerate(instructions, 1))
+    return "".join((_RESEARCH_INJECTION_HEADER, *sections, _RESEARCH_INJECTION_FOOTER, footer))
 
-# ============================================================================
-# WEEK SPEC PROMPT - Generates complete 12-file week specification
-# ============================================================================
 
 def task_week_spec(
     week_number: int,
     manifest_entry: Dict[str, Any],
     research_plan: Optional[Dict[str, Any]] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate complete Week Spec kit (12 files) for a single week.
 
@@ -468,144 +1013,37 @@ def task_week_spec(
         research_plan: Optional PHASE 0 research findings (12 outputs)
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with week_info and generated_files array
     """
     prompt_spec = _load_prompt_json("week/week_spec.json")
 
-    # Build user prompt with interpolated manifest entry
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-
-    # Replace week_number
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-
-    # Replace manifest entry fields
-    user_content = user_content.replace(
-        "{{week_manifest_entry.title}}",
-        manifest_entry.get("title", "")
-    )
-    user_content = user_content.replace(
-        "{{week_manifest_entry.grammar_focus}}",
-        manifest_entry.get("grammar_focus", "")
-    )
-    user_content = user_content.replace(
-        "{{week_manifest_entry.chant}}",
-        manifest_entry.get("chant", "")
-    )
-    user_content = user_content.replace(
-        "{{week_manifest_entry.virtue_focus}}",
-        manifest_entry.get("virtue_focus", "")
-    )
-    user_content = user_content.replace(
-        "{{week_manifest_entry.faith_phrase}}",
-        manifest_entry.get("faith_phrase", "")
-    )
+    values = {
+        "week_number": str(week_number),
+        "week_manifest_entry.title": manifest_entry.get("title", ""),
+        "week_manifest_entry.grammar_focus": manifest_entry.get("grammar_focus", ""),
+        "week_manifest_entry.chant": manifest_entry.get("chant", ""),
+        "week_manifest_entry.virtue_focus": manifest_entry.get("virtue_focus", ""),
+        "week_manifest_entry.faith_phrase": manifest_entry.get("faith_phrase", "")
+    }
+    # vocabulary_scope is an array, embedded as JSON only if the template uses it
+    if "week_manifest_entry.vocabulary_scope" in prompt_spec["_placeholders"]:
+        values["week_manifest_entry.vocabulary_scope"] = orjson.dumps(manifest_entry.get("vocabulary_scope", [])).decode()
 
-    # Replace vocabulary_scope (array)
-    vocab_scope = manifest_entry.get("vocabulary_scope", [])
-    vocab_json = json.dumps(vocab_scope)
-    user_content = user_content.replace("{{week_manifest_entry.vocabulary_scope}}", vocab_json)
+    # Build user prompt with interpolated manifest entry
+    chunks = [_render_template(prompt_spec["_user_template"], values)]
 
     # INJECT PHASE 0 RESEARCH if available
     if research_plan:
-        # Extract all 12 research outputs
-        week_entry = research_plan.get("00_week_entry", {})
-        backward = research_plan.get("01_backward_analysis", {})
-        forward = research_plan.get("02_forward_analysis", {})
-        pedagogy = research_plan.get("03_pedagogical_research", {})
-        vocab_plan = research_plan.get("04_vocabulary_plan", {})
-        duration = research_plan.get("05_session_duration", {})
-        virtue = research_plan.get("06_virtue_faith_strategy", {})
-        assessment = research_plan.get("07_assessment_plan", {})
-        differentiation = research_plan.get("08_differentiation_plan", {})
-        materials = research_plan.get("09_materials_list", {})
-        masters = research_plan.get("10_master_analysis", {})
-        alignment = research_plan.get("11_alignment_guide", {})
-
-        research_injection = f"""
-
-## PHASE 0 RESEARCH FINDINGS - USE ALL OF THIS DATA
-
-You have access to comprehensive pedagogical research conducted before generation.
-ALL of these findings MUST inform your week spec generation:
-
-### 1. VERIFIED VOCABULARY (MUST USE EXACTLY)
-New Latin Words (verified by reasoning model):
-{json.dumps([{'word': w.get('word', ''), 'english': w.get('english', ''), 'rationale': w.get('rationale', '')} for w in vocab_plan.get('new_latin_words', [])], indent=2)}
-
-Recycled Words (for spiral review):
-{json.dumps([{'word': w.get('word', ''), 'originally_taught_week': w.get('originally_taught_week', '')} for w in vocab_plan.get('recycled_latin_words', [])], indent=2)}
-
-Alignment Check: {json.dumps(vocab_plan.get('alignment_check', {}), indent=2)}
-
-CRITICAL: Use ONLY these words in 03_vocabulary.json. Do NOT generate different vocabulary.
-
-### 2. PRIOR KNOWLEDGE (for 07_prior_knowledge_digest.json)
-Students entering this week already know:
-- Vocabulary: {json.dumps([v.get('word', '') for v in backward.get('cumulative_latin_vocabulary', [])[:10]], indent=2)}
-- Grammar Concepts: {json.dumps([c.get('concept', '') for c in backward.get('cumulative_grammar_concepts', [])[:5]], indent=2)}
-- Student State: {backward.get('student_knowledge_state', '')}
-- Spiral Target: {backward.get('spiral_review_target_percentage', 0.25)*100}% prior content
-
-### 3. PEDAGOGICAL APPROACH (for 04_grammar_focus.md and 10_teacher_notes.md)
-How classical curricula teach this topic:
-- Logos Latin Approach: {pedagogy.get('logos_latin_approach', '')[:200]}...
-- Time-Tested Chants: {json.dumps(pedagogy.get('time_tested_chants', []), indent=2)}
-- Common Misconceptions: {json.dumps(pedagogy.get('common_misconceptions', []), indent=2)}
-
-### 4. SESSION TIMING (for daily structure)
-- Recommended Duration: {duration.get('recommended_duration_minutes', 15)} minutes
-- Time Breakdown: {json.dumps(duration.get('time_breakdown', {}), indent=2)}
-
-### 5. VIRTUE & FAITH INTEGRATION (for 05_virtue_focus.md and 06_faith_phrase.md)
-- Virtue: {virtue.get('virtue_focus', '')}
-- Connection to Learning: {virtue.get('virtue_connection_to_language_learning', '')[:150]}...
-- Scripture: {virtue.get('scripture_reference', {}).get('passage', '')} - "{virtue.get('scripture_reference', {}).get('text', '')[:100]}..."
-- Faith Phrase: {virtue.get('faith_phrase', '')}
-- Explanation: {virtue.get('faith_phrase_explanation', '')[:150]}...
-
-### 6. ASSESSMENT DESIGN (for 09_assessment_overview.json)
-Day 4 Quiz Components:
-{json.dumps([{'component': c.get('component', ''), 'format': c.get('format', '')} for c in assessment.get('day_4_quiz_components', [])], indent=2)}
-
-### 7. DIFFERENTIATION (for 10_teacher_notes.md)
-- Struggling Students: {json.dumps(differentiation.get('struggling_students', {}).get('scaffolds', [])[:3], indent=2)}
-- Advanced Students: {json.dumps(differentiation.get('advanced_students', {}).get('extensions', [])[:3], indent=2)}
-
-### 8. MATERIALS NEEDED (for 10_teacher_notes.md)
-- Chant Charts: {json.dumps([c.get('title', '') for c in materials.get('chant_charts', [])], indent=2)}
-- Flashcard Sets: {json.dumps([s.get('set_name', '') for s in materials.get('flashcard_sets', [])], indent=2)}
+        chunks.append(_build_research_injection(research_plan))
 
-### 9. STYLE GUIDE (from gold standard Week 1 & Week 11)
-Class Name Pattern: {masters.get('class_name_pattern', '')}
-Summary Style: {json.dumps(masters.get('summary_style_guide', {}), indent=2)}
-Vocabulary Format: {json.dumps(masters.get('vocabulary_format', {}), indent=2)}
+    user_content = "".join(chunks)
 
-### 10. ALIGNMENT GUIDANCE (how to combine research with style)
-{json.dumps(alignment, indent=2)}
+    system_content = prompt_spec["_system"]
 
----
-
-GENERATION INSTRUCTIONS:
-1. Use ONLY the verified vocabulary from section 1
-2. Include spiral review from section 2 in 07_prior_knowledge_digest.json
-3. Use pedagogical approach from section 3 in grammar explanations
-4. Use timing from section 4 to structure daily activities
-5. Use virtue/faith from section 5 in 05_virtue_focus.md and 06_faith_phrase.md
-6. Use assessment design from section 6 in 09_assessment_overview.json
-7. Use differentiation from section 7 in 10_teacher_notes.md
-8. Match style patterns from sections 9 & 10
-"""
-        user_content += research_injection
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"]
-    }
+    config = _spec_config(prompt_spec)
 
     return (system_content, user_content, config)
 
@@ -617,7 +1055,7 @@ GENERATION INSTRUCTIONS:
 def task_prior_knowledge_digest(
     current_week_number: int,
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate prior_knowledge_digest.json for spiral learning validation.
 
@@ -640,30 +1078,24 @@ def task_prior_knowledge_digest(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON digest saved to Week_Spec/07_prior_knowledge_digest.json
     """
     prompt_spec = _load_prompt_json("digest/prior_knowledge_digest.json")
 
-    # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{current_week_number}}", str(current_week_number))
-    user_content = user_content.replace("{{project_root}}", project_root)
-
-    # Replace dynamic expressions like {{current_week_number - 1}}
-    user_content = user_content.replace(
-        "{{current_week_number - 1}}",
-        str(current_week_number - 1)
-    )
+    # Build user prompt with interpolated values, including dynamic
+    # expressions like {{current_week_number - 1}}
+    user_content = _render_template(prompt_spec["_user_template"], {
+        "current_week_number": str(current_week_number),
+        "project_root": project_root,
+        "current_week_number - 1": str(current_week_number - 1)
+    })
 
-    system_content = prompt_spec["messages"][0]["content_template"]
+    system_content = prompt_spec["_system"]
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"]
-    }
+    config = _spec_config(prompt_spec)
 
     return (system_content, user_content, config)
 
@@ -677,7 +1109,7 @@ def task_week_summary(
     week_spec: Optional[Dict[str, Any]] = None,
     prior_knowledge_digest: Optional[Dict[str, Any]] = None,
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate 00_week_summary.md - human-readable week overview.
 
@@ -707,50 +1139,48 @@ def task_week_summary(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with week_number, file_name, and markdown content string
     """
     prompt_spec = _load_prompt_json("week/week_summary.json")
 
-    # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{project_root}}", project_root)
+    values = {
+        "week_number": str(week_number),
+        "project_root": project_root
+    }
 
     # If week_spec provided, serialize it for context
     if week_spec:
-        week_spec_json = json.dumps(week_spec, indent=2)
-        user_content = user_content.replace("{{week_spec}}", week_spec_json)
+        values["week_spec"] = _to_json(week_spec)
     else:
         # Placeholder for file reference
-        user_content = user_content.replace(
-            "{{week_spec}}",
-            f"Load from {project_root}/Week{week_number:02d}/Week_Spec/99_compiled_week_spec.json"
-        )
+        values["week_spec"] = f"Load from {project_root}/Week{week_number:02d}/Week_Spec/99_compiled_week_spec.json"
 
     # If prior_knowledge_digest provided, serialize it
     if prior_knowledge_digest:
-        digest_json = json.dumps(prior_knowledge_digest, indent=2)
-        user_content = user_content.replace("{{prior_knowledge_digest}}", digest_json)
+        values["prior_knowledge_digest"] = _dumps_pretty(prior_knowledge_digest)
     else:
         # Placeholder for file reference
-        user_content = user_content.replace(
-            "{{prior_knowledge_digest}}",
+        values["prior_knowledge_digest"] = (
             f"Load from {project_root}/Week{week_number:02d}/Week_Spec/07_prior_knowledge_digest.json"
         )
 
-    system_content = prompt_spec["messages"][0]["content_template"]
+    # Build user prompt with interpolated values
+    user_content = _render_template(prompt_spec["_user_template"], values)
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"]
-    }
+    system_content = prompt_spec["_system"]
+
+    config = _spec_config(prompt_spec)
 
     return (system_content, user_content, config)
 
 
+# Compact rendering of a role context payload with no week data
+_EMPTY_RC_PAYLOAD = '{"metadata":{},"spiral_links":{}}'
+
+
 def task_role_context(week_spec: dict, research_plan: Optional[Dict[str, Any]] = None) -> Tuple[str, str, Optional[Dict]]:
     """
     Generate prompts for Sparky role context (week-level).
@@ -780,22 +1210,21 @@ def task_role_context(week_spec: dict, research_plan: Optional[Dict[str, Any]] =
         "Return only valid JSON."
     )
 
-    usr = (
-        "Base this Sparky role context on the week metadata and spiral links:\n\n"
-        + orjson.dumps(
-            {
-                "metadata": week_spec.get("01_metadata.json", {}),
-                "spiral_links": week_spec.get("09_spiral_links.json", {})
-            },
-            option=orjson.OPT_INDENT_2
-        ).decode()
-    )
+    metadata = week_spec.get("01_metadata.json", {})
+    spiral_links = week_spec.get("09_spiral_links.json", {})
+    if metadata == {} and spiral_links == {}:
+        # Unspecified week: reuse the pre-rendered payload
+        payload = _EMPTY_RC_PAYLOAD
+    else:
+        payload = _dumps_compact({"metadata": metadata, "spiral_links": spiral_links})
+
+    usr = "Base this Sparky role context on the week metadata and spiral links:\n\n" + payload
 
     # Inject PHASE 0 research if available
     if research_plan:
-        virtue = research_plan.get("06_virtue_faith_strategy", {})
-        differentiation = research_plan.get("08_differentiation_plan", {})
-        pedagogy = research_plan.get("03_pedagogical_research", {})
+        virtue = research_plan.get("06_virtue_faith_strategy", _EMPTY)
+        differentiation = research_plan.get("08_differentiation_plan", _EMPTY)
+        pedagogy = research_plan.get("03_pedagogical_research", _EMPTY)
 
         research_context = f"""
 
@@ -809,12 +1238,12 @@ Adapt Sparky's role context based on this week's needs:
 - Incorporate this virtue into encouragement_triggers and praise language
 
 ### Differentiation Needs:
-- Struggling Students Scaffolds: {json.dumps(differentiation.get('struggling_students', {}).get('scaffolds', [])[:2], indent=2)}
-- Advanced Extensions: {json.dumps(differentiation.get('advanced_students', {}).get('extensions', [])[:2], indent=2)}
+- Struggling Students Scaffolds: {_dumps_pretty(differentiation.get('struggling_students', _EMPTY).get('scaffolds', [])[:2])}
+- Advanced Extensions: {_dumps_pretty(differentiation.get('advanced_students', _EMPTY).get('extensions', [])[:2])}
 - Adjust feedback_style to support both groups
 
 ### Common Misconceptions:
-{json.dumps(pedagogy.get('common_misconceptions', [])[:3], indent=2)}
+{_dumps_pretty(pedagogy.get('common_misconceptions', [])[:3])}
 - Include these in knowledge_recycling and error correction approaches
 
 Generate a Sparky role context that adapts to this week's virtue, difficulty level, and student needs.
@@ -848,15 +1277,12 @@ def task_assets(week_spec: dict) -> Tuple[str, str, Optional[Dict]]:
 
     usr = (
         "Week information:\n\n"
-        + orjson.dumps(
-            {
-                "title": week_spec.get("01_metadata.json", {}).get("title", ""),
-                "vocabulary": week_spec.get("03_vocabulary.json", [])[:5],  # Sample
-                "chant": week_spec.get("05_chant.json", {}),
-                "virtue_focus": week_spec.get("01_metadata.json", {}).get("virtue_focus", "")
-            },
-            option=orjson.OPT_INDENT_2
-        ).decode()
+        + _dumps_compact({
+            "title": week_spec.get("01_metadata.json", {}).get("title", ""),
+            "vocabulary": week_spec.get("03_vocabulary.json", [])[:5],  # Sample
+            "chant": week_spec.get("05_chant.json", {}),
+            "virtue_focus": week_spec.get("01_metadata.json", {}).get("virtue_focus", "")
+        })
     )
 
     return sys, usr, None
@@ -866,6 +1292,17 @@ def task_assets(week_spec: dict) -> Tuple[str, str, Optional[Dict]]:
 # CLASS NAME PROMPT (Field 01) - Student-facing lesson title
 # ============================================================================
 
+# Day intents indexed by day number (1-4); index 0 is unused
+_DAY_INTENT_SHORT = ("Learn", "Learn", "Practice", "Review", "Quiz")
+_DAY_INTENT_LONG = (
+    "Learn",
+    "Learn: introduce new grammar, vocabulary, and chant.",
+    "Practice: review, translate, and recite.",
+    "Review: answer questions and reinforce mastery.",
+    "Quiz: assess learning and reflect on progress."
+)
+
+
 def task_class_name(
     week_number: int,
     day_number: int,
@@ -873,7 +1310,7 @@ def task_class_name(
     grammar_focus: str,
     chant: str,
     vocabulary_scope: Optional[list] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate class_name (field 01) - student-facing lesson title.
 
@@ -896,7 +1333,7 @@ def task_class_name(
         vocabulary_scope: Optional vocabulary list from manifest
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with single key: {"class_name": "..."}
@@ -904,26 +1341,25 @@ def task_class_name(
     prompt_spec = _load_prompt_json("day/class_name.json")
 
     # Map day number to intent
-    day_intents = {1: "Learn", 2: "Practice", 3: "Review", 4: "Quiz"}
-    day_intent = day_intents.get(day_number, "Learn")
+    day_intent = _DAY_INTENT_SHORT[day_number] if 1 <= day_number <= 4 else "Learn"
 
     # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_name}}", prompt_spec["inputs"]["project_name"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day_number))
-    user_content = user_content.replace("{{week_title}}", week_title)
-    user_content = user_content.replace("{{grammar_focus}}", grammar_focus)
-    user_content = user_content.replace("{{chant}}", chant)
-    user_content = user_content.replace("{{day_intent[day_number]}}", day_intent)
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]  # Note: uses gpt-4o-mini
-    }
+    user_content = _render_template(
+        prompt_spec["_user_template"],
+        {
+            "project_name": prompt_spec["inputs"]["project_name"],
+            "week_number": str(week_number),
+            "day_number": str(day_number),
+            "week_title": week_title,
+            "grammar_focus": grammar_focus,
+            "chant": chant,
+            "day_intent[day_number]": day_intent
+        }
+    )
+
+    system_content = prompt_spec["_system"]
+
+    config = _spec_config(prompt_spec, include_model=True)
 
     return (system_content, user_content, config)
 
@@ -938,7 +1374,7 @@ def task_day_summary(
     class_name: str,
     week_spec: Optional[Dict[str, Any]] = None,
     prior_knowledge_digest: Optional[Dict[str, Any]] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate 02_summary.md - daily lesson summary markdown.
 
@@ -968,7 +1404,7 @@ def task_day_summary(
         prior_knowledge_digest: Optional prior knowledge digest
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with single key: {"day_summary": "...markdown..."}
@@ -976,61 +1412,39 @@ def task_day_summary(
     prompt_spec = _load_prompt_json("day/day_summary.json")
 
     # Map day number to intent
-    day_intents = {
-        1: "Learn: introduce new grammar, vocabulary, and chant.",
-        2: "Practice: review, translate, and recite.",
-        3: "Review: answer questions and reinforce mastery.",
-        4: "Quiz: assess learning and reflect on progress."
-    }
-    day_intent = day_intents.get(day_number, "Learn")
+    day_intent = _DAY_INTENT_LONG[day_number] if 1 <= day_number <= 4 else "Learn"
 
-    # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day_number))
-    user_content = user_content.replace("{{class_name}}", class_name)
-    user_content = user_content.replace("{{day_intent[day_number]}}", day_intent)
+    values = {
+        "week_number": str(week_number),
+        "day_number": str(day_number),
+        "class_name": class_name,
+        "day_intent[day_number]": day_intent
+    }
 
     # If week_spec provided, interpolate its fields
     if week_spec:
         metadata = week_spec.get("01_metadata.json", {})
-        user_content = user_content.replace(
-            "{{week_spec.title}}",
-            metadata.get("week_title", "")
-        )
-        user_content = user_content.replace(
-            "{{week_spec.grammar_focus}}",
-            metadata.get("grammar_focus", "")
-        )
         chant_data = week_spec.get("05_chant.json", {})
         chant_text = chant_data.get("text", "") if isinstance(chant_data, dict) else str(chant_data)
-        user_content = user_content.replace(
-            "{{week_spec.chant}}",
-            chant_text
-        )
-        user_content = user_content.replace(
-            "{{week_spec.virtue_focus}}",
-            metadata.get("virtue_focus", "")
-        )
-        user_content = user_content.replace(
-            "{{week_spec.faith_phrase}}",
-            metadata.get("faith_phrase", "")
-        )
+        values["week_spec.title"] = metadata.get("week_title", "")
+        values["week_spec.grammar_focus"] = metadata.get("grammar_focus", "")
+        values["week_spec.chant"] = chant_text
+        values["week_spec.virtue_focus"] = metadata.get("virtue_focus", "")
+        values["week_spec.faith_phrase"] = metadata.get("faith_phrase", "")
     else:
         # Leave placeholders for file/API reference
-        user_content = user_content.replace("{{week_spec.title}}", "[Load from week spec]")
-        user_content = user_content.replace("{{week_spec.grammar_focus}}", "[Load from week spec]")
-        user_content = user_content.replace("{{week_spec.chant}}", "[Load from week spec]")
-        user_content = user_content.replace("{{week_spec.virtue_focus}}", "[Load from week spec]")
-        user_content = user_content.replace("{{week_spec.faith_phrase}}", "[Load from week spec]")
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]  # gpt-4o-mini
-    }
+        values["week_spec.title"] = _LOAD_FROM_SPEC
+        values["week_spec.grammar_focus"] = _LOAD_FROM_SPEC
+        values["week_spec.chant"] = _LOAD_FROM_SPEC
+        values["week_spec.virtue_focus"] = _LOAD_FROM_SPEC
+        values["week_spec.faith_phrase"] = _LOAD_FROM_SPEC
+
+    # Build user prompt with interpolated values
+    user_content = _render_template(prompt_spec["_user_template"], values)
+
+    system_content = prompt_spec["_system"]
+
+    config = _spec_config(prompt_spec, include_model=True)
 
     return (system_content, user_content, config)
 
@@ -1042,7 +1456,7 @@ def task_day_summary(
 def task_grade_level(
     week_number: int,
     day_number: int
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate 03_grade_level.txt - fixed grade level metadata.
 
@@ -1060,7 +1474,7 @@ def task_grade_level(
         day_number: Day number (1-4)
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with single key: {"grade_level": "Grade 3 (Grammar Stage, U.S.)"}
@@ -1068,17 +1482,14 @@ def task_grade_level(
     prompt_spec = _load_prompt_json("day/grade_level.json")
 
     # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day_number))
+    user_content = _render_template(
+        prompt_spec["_user_template"],
+        {"week_number": str(week_number), "day_number": str(day_number)}
+    )
 
-    system_content = prompt_spec["messages"][0]["content_template"]
+    system_content = prompt_spec["_system"]
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]  # gpt-4o-mini
-    }
+    config = _spec_config(prompt_spec, include_model=True)
 
     return (system_content, user_content, config)
 
@@ -1087,14 +1498,80 @@ def task_grade_level(
 # ROLE_CONTEXT PROMPT (Field 04) - Day-level Sparky coaching brief
 # ============================================================================
 
+@lru_cache(maxsize=256)
+def _day_fallbacks(week_number: int, day_number: int) -> Dict[str, str]:
+    """
+    "[Load from ...]" stand-ins for inputs a day-level task was not given.
+
+    Built once per (week, day) instead of formatting each path on every
+    call. Callers read from the shared dict and must not mutate it.
+    """
+    week_dir = f"curriculum/LatinA/Week{week_number:02d}"
+    day_dir = f"{week_dir}/Day{day_number:02d}"
+    return {
+        "week_spec": f"[Load from {week_dir}/Week_Spec/99_compiled_week_spec.json]",
+        "prior_knowledge_digest": f"[Load from {week_dir}/Week_Spec/07_prior_knowledge_digest.json]",
+        "day_summary": f"[Load from {day_dir}/02_summary.md]",
+        "role_context": f"[Load from {day_dir}/04_role_context.json]",
+        "guidelines": f"[Load from {day_dir}/05_guidelines_for_sparky.md]",
+        "day_document": f"[Load from {day_dir}/06_document_for_sparky.json]"
+    }
+
+
+def _day_context_values(
+    prompt_spec: Mapping[str, Any],
+    week_number: int,
+    day_number: int,
+    class_name: str,
+    week_spec: Optional[Union[Dict[str, Any], SerializedDict]],
+    prior_knowledge_digest: Optional[Union[Dict[str, Any], SerializedDict]],
+    day_summary: Optional[Any]
+) -> Dict[str, str]:
+    """Placeholder values shared by the role context and guidelines prompts."""
+    fallbacks = _day_fallbacks(week_number, day_number)
+    placeholders = prompt_spec["_placeholders"]
+    values = {
+        "project_name": prompt_spec["inputs"]["project_name"],
+        "week_number": str(week_number),
+        "day_number": str(day_number),
+        "class_name": class_name,
+        "grade_level_fixed": prompt_spec["inputs"]["grade_level_fixed"]
+    }
+
+    # If week_spec provided, serialize it
+    if week_spec and "week_spec" in placeholders:
+        values["week_spec"] = _to_json(week_spec)
+    else:
+        values["week_spec"] = fallbacks["week_spec"]
+
+    # If prior_knowledge_digest provided, serialize it
+    if prior_knowledge_digest and "prior_knowledge_digest" in placeholders:
+        values["prior_knowledge_digest"] = _to_json(prior_knowledge_digest)
+    else:
+        values["prior_knowledge_digest"] = fallbacks["prior_knowledge_digest"]
+
+    # If day_summary provided, serialize it
+    if day_summary:
+        if isinstance(day_summary, dict) and "day_summary" in day_summary:
+            values["day_summary"] = day_summary["day_summary"]
+        elif isinstance(day_summary, str):
+            values["day_summary"] = day_summary
+        else:
+            values["day_summary"] = json.dumps(day_summary)
+    else:
+        values["day_summary"] = fallbacks["day_summary"]
+
+    return values
+
+
 def task_role_context_day(
     week_number: int,
     day_number: int,
     class_name: str,
-    week_spec: Optional[Dict[str, Any]] = None,
-    prior_knowledge_digest: Optional[Dict[str, Any]] = None,
+    week_spec: Optional[Union[Dict[str, Any], SerializedDict]] = None,
+    prior_knowledge_digest: Optional[Union[Dict[str, Any], SerializedDict]] = None,
     day_summary: Optional[Dict[str, Any]] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate 04_role_context.json - Day-level coaching brief for Sparky.
 
@@ -1141,65 +1618,19 @@ def task_role_context_day(
         day_summary: Optional day summary
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with complete DayRoleContext schema
     """
     prompt_spec = _load_prompt_json("day/role_context.json")
 
-    # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_name}}", prompt_spec["inputs"]["project_name"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day_number))
-    user_content = user_content.replace("{{class_name}}", class_name)
-    user_content = user_content.replace("{{grade_level_fixed}}", prompt_spec["inputs"]["grade_level_fixed"])
-
-    # If week_spec provided, serialize it
-    if week_spec:
-        week_spec_json = json.dumps(week_spec, indent=2)
-        user_content = user_content.replace("{{week_spec}}", week_spec_json)
-    else:
-        user_content = user_content.replace(
-            "{{week_spec}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Week_Spec/99_compiled_week_spec.json]"
-        )
-
-    # If prior_knowledge_digest provided, serialize it
-    if prior_knowledge_digest:
-        digest_json = json.dumps(prior_knowledge_digest, indent=2)
-        user_content = user_content.replace("{{prior_knowledge_digest}}", digest_json)
-    else:
-        user_content = user_content.replace(
-            "{{prior_knowledge_digest}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Week_Spec/07_prior_knowledge_digest.json]"
-        )
-
-    # If day_summary provided, serialize it
-    if day_summary:
-        if isinstance(day_summary, dict) and "day_summary" in day_summary:
-            summary_content = day_summary["day_summary"]
-        elif isinstance(day_summary, str):
-            summary_content = day_summary
-        else:
-            summary_content = json.dumps(day_summary)
-        user_content = user_content.replace("{{day_summary}}", summary_content)
-    else:
-        user_content = user_content.replace(
-            "{{day_summary}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Day{day_number:02d}/02_summary.md]"
-        )
-
-    system_content = prompt_spec["messages"][0]["content_template"]
+    values = _day_context_values(
+        prompt_spec, week_number, day_number, class_name,
+        week_spec, prior_knowledge_digest, day_summary
+    )
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]  # gpt-4o
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, values)
 
 
 # ============================================================================
@@ -1210,11 +1641,12 @@ def task_guidelines(
     week_number: int,
     day_number: int,
     class_name: str,
-    week_spec: Optional[Dict[str, Any]] = None,
-    prior_knowledge_digest: Optional[Dict[str, Any]] = None,
+    week_spec: Optional[Union[Dict[str, Any], SerializedDict]] = None,
+    prior_knowledge_digest: Optional[Union[Dict[str, Any], SerializedDict]] = None,
     day_summary: Optional[Dict[str, Any]] = None,
-    role_context: Optional[Dict[str, Any]] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+    role_context: Optional[Union[Dict[str, Any], SerializedDict]] = None,
+    role_context_serialized: Optional[Dict[str, str]] = None
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate 05_guidelines_for_sparky.md - Minute-by-minute teaching script.
 
@@ -1250,77 +1682,32 @@ def task_guidelines(
         prior_knowledge_digest: Optional prior knowledge digest
         day_summary: Optional day summary
         role_context: Optional role context from prompt_for_role_context
+        role_context_serialized: Optional output of prepare_role_context_variants
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with single key: {"guidelines_markdown": "...markdown..."}
     """
     prompt_spec = _load_prompt_json("day/guidelines.json")
+    fallbacks = _day_fallbacks(week_number, day_number)
+    placeholders = prompt_spec["_placeholders"]
 
-    # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_name}}", prompt_spec["inputs"]["project_name"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day_number))
-    user_content = user_content.replace("{{class_name}}", class_name)
-    user_content = user_content.replace("{{grade_level_fixed}}", prompt_spec["inputs"]["grade_level_fixed"])
-
-    # If week_spec provided, serialize it
-    if week_spec:
-        week_spec_json = json.dumps(week_spec, indent=2)
-        user_content = user_content.replace("{{week_spec}}", week_spec_json)
-    else:
-        user_content = user_content.replace(
-            "{{week_spec}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Week_Spec/99_compiled_week_spec.json]"
-        )
-
-    # If prior_knowledge_digest provided, serialize it
-    if prior_knowledge_digest:
-        digest_json = json.dumps(prior_knowledge_digest, indent=2)
-        user_content = user_content.replace("{{prior_knowledge_digest}}", digest_json)
-    else:
-        user_content = user_content.replace(
-            "{{prior_knowledge_digest}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Week_Spec/07_prior_knowledge_digest.json]"
-        )
-
-    # If day_summary provided, serialize it
-    if day_summary:
-        if isinstance(day_summary, dict) and "day_summary" in day_summary:
-            summary_content = day_summary["day_summary"]
-        elif isinstance(day_summary, str):
-            summary_content = day_summary
-        else:
-            summary_content = json.dumps(day_summary)
-        user_content = user_content.replace("{{day_summary}}", summary_content)
-    else:
-        user_content = user_content.replace(
-            "{{day_summary}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Day{day_number:02d}/02_summary.md]"
-        )
+    values = _day_context_values(
+        prompt_spec, week_number, day_number, class_name,
+        week_spec, prior_knowledge_digest, day_summary
+    )
 
-    # If role_context provided, serialize it
-    if role_context:
-        role_context_json = json.dumps(role_context, indent=2)
-        user_content = user_content.replace("{{role_context}}", role_context_json)
+    # If role_context provided, serialize it (or reuse the caller's serialization)
+    if role_context_serialized:
+        values["role_context"] = role_context_serialized["full"]
+    elif role_context and "role_context" in placeholders:
+        values["role_context"] = _to_json(role_context)
     else:
-        user_content = user_content.replace(
-            "{{role_context}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Day{day_number:02d}/04_role_context.json]"
-        )
-
-    system_content = prompt_spec["messages"][0]["content_template"]
+        values["role_context"] = fallbacks["role_context"]
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]  # gpt-4o
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, values)
 
 
 # ============================================================================
@@ -1331,11 +1718,12 @@ def task_document_day(
     week_number: int,
     day_number: int,
     class_name: str,
-    week_spec: Optional[Dict[str, Any]] = None,
-    prior_knowledge_digest: Optional[Dict[str, Any]] = None,
-    role_context: Optional[Dict[str, Any]] = None,
-    guidelines: Optional[str] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+    week_spec: Optional[Union[Dict[str, Any], SerializedDict]] = None,
+    prior_knowledge_digest: Optional[Union[Dict[str, Any], SerializedDict]] = None,
+    role_context: Optional[Union[Dict[str, Any], SerializedDict]] = None,
+    guidelines: Optional[str] = None,
+    role_context_serialized: Optional[Dict[str, str]] = None
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate 06_document_for_sparky.json - Structured JSON lesson plan.
 
@@ -1371,88 +1759,56 @@ def task_document_day(
         week_spec: Optional week spec data
         prior_knowledge_digest: Optional prior knowledge digest
         role_context: Optional role context from prompt_for_role_context
+        role_context_serialized: Optional output of prepare_role_context_variants
         guidelines: Optional guidelines markdown from prompt_for_guidelines
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with single key: {"day_document": {...DayDocument schema...}}
     """
     prompt_spec = _load_prompt_json("day/day_document.json")
+    fallbacks = _day_fallbacks(week_number, day_number)
+    placeholders = prompt_spec["_placeholders"]
+
+    values = {
+        "week_number": str(week_number),
+        "day_number": str(day_number),
+        "class_name": class_name,
+        "grade_level": prompt_spec["inputs"]["grade_level"]
+    }
 
-    # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day_number))
-    user_content = user_content.replace("{{class_name}}", class_name)
-    user_content = user_content.replace("{{grade_level}}", prompt_spec["inputs"]["grade_level"])
-
-    # If week_spec provided, serialize it (excerpt: first 500 chars to save tokens)
-    if week_spec:
-        week_spec_json = json.dumps(week_spec, indent=2)
-        # Truncate if very large
-        if len(week_spec_json) > 2000:
-            week_spec_excerpt = week_spec_json[:2000] + "\n... (truncated)"
-        else:
-            week_spec_excerpt = week_spec_json
-        user_content = user_content.replace("{{week_spec}}", week_spec_excerpt)
+    # If week_spec provided, serialize it (excerpt: first 2000 chars to save tokens)
+    if week_spec and "week_spec" in placeholders:
+        values["week_spec"] = _dumps_truncated(week_spec, 2000)
     else:
-        user_content = user_content.replace(
-            "{{week_spec}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Week_Spec/99_compiled_week_spec.json]"
-        )
+        values["week_spec"] = fallbacks["week_spec"]
 
     # If prior_knowledge_digest provided, serialize it (excerpt)
-    if prior_knowledge_digest:
-        digest_json = json.dumps(prior_knowledge_digest, indent=2)
-        if len(digest_json) > 1000:
-            digest_excerpt = digest_json[:1000] + "\n... (truncated)"
-        else:
-            digest_excerpt = digest_json
-        user_content = user_content.replace("{{prior_knowledge_digest}}", digest_excerpt)
+    if prior_knowledge_digest and "prior_knowledge_digest" in placeholders:
+        values["prior_knowledge_digest"] = _dumps_truncated(prior_knowledge_digest, 1000)
     else:
-        user_content = user_content.replace(
-            "{{prior_knowledge_digest}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Week_Spec/07_prior_knowledge_digest.json]"
-        )
+        values["prior_knowledge_digest"] = fallbacks["prior_knowledge_digest"]
 
     # If role_context provided, serialize it (excerpt)
-    if role_context:
-        role_context_json = json.dumps(role_context, indent=2)
-        if len(role_context_json) > 1500:
-            role_context_excerpt = role_context_json[:1500] + "\n... (truncated)"
-        else:
-            role_context_excerpt = role_context_json
-        user_content = user_content.replace("{{role_context}}", role_context_excerpt)
+    if role_context_serialized:
+        values["role_context"] = role_context_serialized["truncated"]
+    elif role_context and "role_context" in placeholders:
+        values["role_context"] = _dumps_truncated(role_context, 1500)
     else:
-        user_content = user_content.replace(
-            "{{role_context}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Day{day_number:02d}/04_role_context.json]"
-        )
+        values["role_context"] = fallbacks["role_context"]
 
     # If guidelines provided, use excerpt (first 1000 chars)
     if guidelines:
         if len(guidelines) > 1000:
-            guidelines_excerpt = guidelines[:1000] + "\n... (truncated)"
+            values["guidelines"] = guidelines[:1000] + _TRUNCATED_MARKER
         else:
-            guidelines_excerpt = guidelines
-        user_content = user_content.replace("{{guidelines}}", guidelines_excerpt)
+            values["guidelines"] = guidelines
     else:
-        user_content = user_content.replace(
-            "{{guidelines}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Day{day_number:02d}/05_guidelines_for_sparky.md]"
-        )
-
-    system_content = prompt_spec["messages"][0]["content_template"]
+        values["guidelines"] = fallbacks["guidelines"]
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]  # gpt-4o
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, values)
 
 
 # ============================================================================
@@ -1463,10 +1819,11 @@ def task_greeting(
     week_number: int,
     day_number: int,
     class_name: str,
-    week_spec: Optional[Dict[str, Any]] = None,
-    role_context: Optional[Dict[str, Any]] = None,
-    day_document: Optional[Dict[str, Any]] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+    week_spec: Optional[Union[Dict[str, Any], SerializedDict]] = None,
+    role_context: Optional[Union[Dict[str, Any], SerializedDict]] = None,
+    day_document: Optional[Dict[str, Any]] = None,
+    role_context_serialized: Optional[Dict[str, str]] = None
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate 07_sparkys_greeting.txt - Cheerful closing message from Sparky.
 
@@ -1497,72 +1854,57 @@ def task_greeting(
         week_spec: Optional week spec data (for virtue_focus, faith_phrase)
         role_context: Optional role context (for Sparky's identity)
         day_document: Optional day document (for lesson_steps summary)
+        role_context_serialized: Optional output of prepare_role_context_variants
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with single key: {"greeting_text": "...cheerful message..."}
     """
     prompt_spec = _load_prompt_json("day/greeting.json")
-
-    # Build user prompt with interpolated values
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day_number))
-    user_content = user_content.replace("{{class_name}}", class_name)
-    user_content = user_content.replace("{{grade_level}}", prompt_spec["inputs"]["grade_level"])
+    fallbacks = _day_fallbacks(week_number, day_number)
+    placeholders = prompt_spec["_placeholders"]
+
+    values = {
+        "week_number": str(week_number),
+        "day_number": str(day_number),
+        "class_name": class_name,
+        "grade_level": prompt_spec["inputs"]["grade_level"]
+    }
 
     # Extract virtue and faith phrase from week_spec
     if week_spec:
-        virtue_focus = week_spec.get("virtue_focus", "diligence")
-        faith_phrase = week_spec.get("faith_phrase", "Gloria Deo")
-        user_content = user_content.replace("{{week_spec.virtue_focus}}", virtue_focus)
-        user_content = user_content.replace("{{week_spec.faith_phrase}}", faith_phrase)
+        values["week_spec.virtue_focus"] = week_spec.get("virtue_focus", "diligence")
+        values["week_spec.faith_phrase"] = week_spec.get("faith_phrase", "Gloria Deo")
     else:
-        user_content = user_content.replace("{{week_spec.virtue_focus}}", "[Load from week spec]")
-        user_content = user_content.replace("{{week_spec.faith_phrase}}", "[Load from week spec]")
+        values["week_spec.virtue_focus"] = _LOAD_FROM_SPEC
+        values["week_spec.faith_phrase"] = _LOAD_FROM_SPEC
 
     # If role_context provided, serialize excerpt
-    if role_context:
+    if role_context_serialized:
+        values["role_context"] = role_context_serialized["pruned"]
+    elif role_context and "role_context" in placeholders:
         # Extract just identity and constraints for brevity
-        role_excerpt = {
-            "identity": role_context.get("identity", "Sparky the Encourager"),
-            "audience": role_context.get("audience", "Grade 3 (Grammar Stage, U.S.)"),
-            "constraints": role_context.get("constraints", {})
-        }
-        role_context_json = json.dumps(role_excerpt, indent=2)
-        user_content = user_content.replace("{{role_context}}", role_context_json)
+        values["role_context"] = _dumps_compact(_role_context_excerpt(role_context))
     else:
-        user_content = user_content.replace(
-            "{{role_context}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Day{day_number:02d}/04_role_context.json]"
-        )
+        values["role_context"] = fallbacks["role_context"]
 
     # If day_document provided, extract lesson_steps titles only for brevity
     if day_document:
-        lesson_steps = day_document.get("lesson_steps", [])
+        lesson_steps = day_document.get("lesson_steps")
         if lesson_steps:
-            step_titles = [step.get("title", "") for step in lesson_steps]
-            lesson_summary = "Lesson steps: " + ", ".join(step_titles)
+            # str.join materializes its argument anyway, so a list
+            # comprehension is cheaper than a generator here
+            values["day_document.lesson_steps"] = "Lesson steps: " + ", ".join(
+                [step.get("title", "") for step in lesson_steps]
+            )
         else:
-            lesson_summary = "No lesson steps found"
-        user_content = user_content.replace("{{day_document.lesson_steps}}", lesson_summary)
+            values["day_document.lesson_steps"] = "No lesson steps found"
     else:
-        user_content = user_content.replace(
-            "{{day_document.lesson_steps}}",
-            f"[Load from curriculum/LatinA/Week{week_number:02d}/Day{day_number:02d}/06_document_for_sparky.json]"
-        )
-
-    system_content = prompt_spec["messages"][0]["content_template"]
+        values["day_document.lesson_steps"] = fallbacks["day_document"]
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]  # gpt-4o
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, values)
 
 
 # ============================================================================
@@ -1575,9 +1917,9 @@ def task_day_repair(
     target_field: str,
     current_content: str,
     validation_report: Dict[str, Any],
-    week_spec: Optional[Dict[str, Any]] = None,
+    week_spec: Optional[Union[Dict[str, Any], SerializedDict]] = None,
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate repair patch for a single day's broken field.
 
@@ -1595,51 +1937,68 @@ def task_day_repair(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with patch, repaired_artifact, resolutions, status
     """
     prompt_spec = _load_prompt_json("repair/day_repair.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_root}}", project_root)
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_id}}", day_id)
-    user_content = user_content.replace("{{target_field}}", target_field)
-    user_content = user_content.replace("{{current_content}}", current_content)
-
-    validation_json = json.dumps(validation_report, indent=2)
-    user_content = user_content.replace("{{validation_report}}", validation_json)
-
-    if week_spec:
-        week_spec_json = json.dumps(week_spec, indent=2)
-        user_content = user_content.replace("{{week_spec}}", week_spec_json)
-    else:
-        user_content = user_content.replace("{{week_spec}}", "[Load from week spec]")
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-    system_content = system_content.replace("{{target_field}}", target_field)
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
+    values = {
+        "project_root": project_root,
+        "week_number": str(week_number),
+        "day_id": day_id,
+        "target_field": target_field,
+        "current_content": current_content,
+        "validation_report": _to_json(validation_report),
+        "week_spec": _LOAD_FROM_SPEC
     }
 
-    return (system_content, user_content, config)
+    # Only serialize the week spec if this template embeds it
+    if week_spec and "week_spec" in prompt_spec["_placeholders"]:
+        values["week_spec"] = _to_json(week_spec)
+
+    return _run_task(prompt_spec, values, {"target_field": target_field})
 
 
 # ============================================================================
 # WEEK REFRESH PROMPT - Minimal regeneration after spec changes
 # ============================================================================
 
+def _spec_diff(old: Mapping[str, Any], new: Mapping[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Structural diff of two week specs keyed by dotted path.
+
+    Nested mappings are walked; any other value (lists included) is compared
+    as a whole.
+    """
+    diff: Dict[str, Dict[str, Any]] = {"changed": {}, "added": {}, "removed": {}}
+
+    def walk(old_node: Mapping[str, Any], new_node: Mapping[str, Any], prefix: str) -> None:
+        for key, new_value in new_node.items():
+            path = f"{prefix}{key}"
+            if key not in old_node:
+                diff["added"][path] = new_value
+                continue
+            old_value = old_node[key]
+            if isinstance(old_value, Mapping) and isinstance(new_value, Mapping):
+                walk(old_value, new_value, path + ".")
+            elif old_value != new_value:
+                diff["changed"][path] = {"from": old_value, "to": new_value}
+        for key, old_value in old_node.items():
+            if key not in new_node:
+                diff["removed"][f"{prefix}{key}"] = old_value
+
+    walk(old, new, "")
+    return diff
+
+
 def task_week_refresh(
     week_number: int,
-    old_week_spec: Dict[str, Any],
-    new_week_spec: Dict[str, Any],
+    old_week_spec: Union[Dict[str, Any], SerializedDict],
+    new_week_spec: Union[Dict[str, Any], SerializedDict],
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate refresh plan for week after spec changes.
 
@@ -1654,34 +2013,20 @@ def task_week_refresh(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with week, plan, artifacts, revalidation, cost_notes
     """
     prompt_spec = _load_prompt_json("refresh/week_refresh.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-
-    old_spec_json = json.dumps(old_week_spec, indent=2)
-    new_spec_json = json.dumps(new_week_spec, indent=2)
-
-    user_content = user_content.replace("{{old_week_spec}}", old_spec_json)
-    user_content = user_content.replace("{{new_week_spec}}", new_spec_json)
-    user_content = user_content.replace(
-        "{{seven_fields}}",
-        json.dumps(prompt_spec["inputs"]["seven_fields"])
-    )
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    # The old spec is sent as a delta against the new one: the model only
+    # needs the new spec in full to regenerate content
+    return _run_task(prompt_spec, {
+        "old_week_spec": _dumps_compact(_spec_diff(old_week_spec, new_week_spec)),
+        "new_week_spec": _to_json(new_week_spec),
+        "seven_fields": json.dumps(prompt_spec["inputs"]["seven_fields"])
+    })
 
 
 # ============================================================================
@@ -1693,7 +2038,7 @@ def task_legacy_migration(
     detected_layouts: Dict[str, Any],
     week_level_role_context: Optional[Dict[str, Any]] = None,
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate migration plan for legacy 6-field to 7-field layout.
 
@@ -1707,34 +2052,23 @@ def task_legacy_migration(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with week, operations, artifacts, post_checks
     """
     prompt_spec = _load_prompt_json("migration/legacy_migration.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-
-    layouts_json = json.dumps(detected_layouts, indent=2)
-    user_content = user_content.replace("{{detected_layouts}}", layouts_json)
-
-    if week_level_role_context:
-        role_json = json.dumps(week_level_role_context, indent=2)
-        user_content = user_content.replace("{{week_level_role_context}}", role_json)
+    if week_level_role_context and "week_level_role_context" in prompt_spec["_placeholders"]:
+        role_json = _to_json(week_level_role_context)
     else:
-        user_content = user_content.replace("{{week_level_role_context}}", "{}")
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
+        role_json = "{}"
 
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "week_number": str(week_number),
+        "detected_layouts": _to_json(detected_layouts),
+        "week_level_role_context": role_json
+    })
 
 
 # ============================================================================
@@ -1746,7 +2080,7 @@ def task_alignment_check(
     week_spec: Dict[str, Any],
     day_bundles: Dict[str, Dict[str, Any]],
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate alignment QA report for week bundle.
 
@@ -1761,45 +2095,29 @@ def task_alignment_check(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         Markdown report with summary, checklist, findings, next actions
     """
     prompt_spec = _load_prompt_json("qa/alignment_check.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-
     # Extract virtue and faith from week_spec
-    virtue = week_spec.get("virtue_focus", week_spec.get("virtue", "N/A"))
-    faith_phrase = week_spec.get("faith_phrase", "N/A")
-
-    user_content = user_content.replace("{{week_spec.virtue}}", virtue)
-    user_content = user_content.replace("{{week_spec.faith_phrase}}", faith_phrase)
-
-    style_constraints = prompt_spec["inputs"]["style_constraints"]
-    user_content = user_content.replace(
-        "{{style_constraints.grade_level}}",
-        style_constraints["grade_level"]
-    )
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
+    virtue, faith_phrase = _extract_virtue_faith(week_spec)
 
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "week_number": str(week_number),
+        "week_spec.virtue": virtue,
+        "week_spec.faith_phrase": faith_phrase,
+        "style_constraints.grade_level": prompt_spec["inputs"]["style_constraints"]["grade_level"]
+    })
 
 
 # ============================================================================
 # LEGACY ROLE_CONTEXT PROMPT (Field 04) - Week-level variant
 # ============================================================================
 
-def task_day_role_context(week_spec: dict, day: int) -> Tuple[str, str, Optional[Dict]]:
+def task_day_role_context(week_spec: Union[dict, SerializedDict], day: int) -> Tuple[str, str, Optional[Dict]]:
     """
     Generate prompts for day-specific role_context (field 04).
 
@@ -1813,7 +2131,7 @@ def task_day_role_context(week_spec: dict, day: int) -> Tuple[str, str, Optional
     - Repair logic hint: prompt suggests fallback if spiral_links missing
 
     Args:
-        week_spec: The week specification data
+        week_spec: The week specification data (a SerializedDict reuses its cached JSON)
         day: Day number (1-4)
 
     Returns:
@@ -1821,45 +2139,49 @@ def task_day_role_context(week_spec: dict, day: int) -> Tuple[str, str, Optional
     """
     # Load prompt from JSON library
     prompt_spec = _load_prompt_json("day/role_context.json")
+    placeholders = prompt_spec["_placeholders"]
 
     # Extract system and user prompts from JSON
-    system_content = prompt_spec["messages"][0]["content_template"]
-    user_template = "\n".join(prompt_spec["messages"][1]["content_template"])
+    system_content = prompt_spec["_system"]
+    user_template = prompt_spec["_user_template"]
 
     # Extract metadata for interpolation (using prefixed key from compiled week spec)
     metadata = week_spec.get("01_metadata.json", {})
     week_number = metadata.get("week", metadata.get("week_number", 1))
 
     # Build user prompt with interpolations (simplified version - we don't have all dependencies yet)
-    user_content = user_template.replace("{{project_name}}", "Latin A (Grammar Stage)")
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day))
-    user_content = user_content.replace("{{grade_level_fixed}}", "Grade 3 (Grammar Stage, U.S.)")
-    user_content = user_content.replace("{{class_name}}", f"Week {week_number} Day {day}")
-
-    # Serialize week_spec for context
-    week_spec_json = json.dumps(week_spec, indent=2)
-    user_content = user_content.replace("{{week_spec}}", week_spec_json)
-
-    # Placeholders for missing dependencies (will be empty for now)
-    user_content = user_content.replace("{{prior_knowledge_digest}}", "{}")
-    user_content = user_content.replace("{{day_summary}}", "")
+    user_content = _render_template(user_template, {
+        "project_name": "Latin A (Grammar Stage)",
+        "week_number": str(week_number),
+        "day_number": str(day),
+        "grade_level_fixed": "Grade 3 (Grammar Stage, U.S.)",
+        "class_name": f"Week {week_number} Day {day}",
+        # Serialize week_spec for context (only if the template embeds it)
+        "week_spec": _to_json(week_spec) if "week_spec" in placeholders else "",
+        # Placeholders for missing dependencies (will be empty for now)
+        "prior_knowledge_digest": "{}",
+        "day_summary": ""
+    })
 
     # Extract JSON schema from output_contract
-    schema = prompt_spec["output_contract"]["schema"]
+    schema = _spec_schema(prompt_spec)
 
     return (system_content, user_content, schema)
 
 
+# Pedagogical focus labels indexed by day number (1-4); index 0 is the fallback
+_DAY_FOCUSES = (
+    "general",
+    "introduction_and_exploration",
+    "practice_and_reinforcement",
+    "application_and_extension",
+    "review_and_spiral_25pct"
+)
+
+
 def _get_day_focus(day: int) -> str:
     """Get pedagogical focus label for day number."""
-    focuses = {
-        1: "introduction_and_exploration",
-        2: "practice_and_reinforcement",
-        3: "application_and_extension",
-        4: "review_and_spiral_25pct"
-    }
-    return focuses.get(day, "general")
+    return _DAY_FOCUSES[day] if 1 <= day <= 4 else _DAY_FOCUSES[0]
 
 
 # ============================================================================
@@ -1868,7 +2190,7 @@ def _get_day_focus(day: int) -> str:
 # ============================================================================
 
 def task_day_guidelines(
-    week_spec: dict,
+    week_spec: Union[dict, SerializedDict],
     day: int,
     role_context: Optional[Dict[str, Any]] = None
 ) -> Tuple[str, str, Optional[Dict]]:
@@ -1884,7 +2206,7 @@ def task_day_guidelines(
     - Repair logic: if role_context missing, prompt generates minimal default
 
     Args:
-        week_spec: Week specification data
+        week_spec: Week specification data (a SerializedDict reuses its cached JSON)
         day: Day number (1-4)
         role_context: Optional role_context dict from field 04
 
@@ -1893,10 +2215,11 @@ def task_day_guidelines(
     """
     # Load prompt from JSON library
     prompt_spec = _load_prompt_json("day/guidelines.json")
+    placeholders = prompt_spec["_placeholders"]
 
     # Extract system and user prompts from JSON
-    system_content = prompt_spec["messages"][0]["content_template"]
-    user_template = "\n".join(prompt_spec["messages"][1]["content_template"])
+    system_content = prompt_spec["_system"]
+    user_template = prompt_spec["_user_template"]
 
     # Handle missing role_context (fallback)
     if not role_context:
@@ -1915,23 +2238,20 @@ def task_day_guidelines(
     week_number = metadata.get("week", metadata.get("week_number", 1))
 
     # Build user prompt with interpolations
-    user_content = user_template.replace("{{project_name}}", "Latin A (Grammar Stage)")
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day))
-    user_content = user_content.replace("{{grade_level_fixed}}", "Grade 3 (Grammar Stage, U.S.)")
-    user_content = user_content.replace("{{class_name}}", f"Week {week_number} Day {day}")
-
-    # Serialize week_spec and role_context for context
-    week_spec_json = json.dumps(week_spec, indent=2)
-    user_content = user_content.replace("{{week_spec}}", week_spec_json)
-
-    role_context_json = json.dumps(role_context, indent=2)
-    user_content = user_content.replace("{{role_context}}", role_context_json)
-
-    # Placeholders for missing dependencies
-    user_content = user_content.replace("{{prior_knowledge_digest}}", "{}")
-    user_content = user_content.replace("{{day_summary}}", "")
-    user_content = user_content.replace("{{week_summary}}", "")
+    user_content = _render_template(user_template, {
+        "project_name": "Latin A (Grammar Stage)",
+        "week_number": str(week_number),
+        "day_number": str(day),
+        "grade_level_fixed": "Grade 3 (Grammar Stage, U.S.)",
+        "class_name": f"Week {week_number} Day {day}",
+        # Serialize week_spec and role_context for context (only if the template embeds them)
+        "week_spec": _to_json(week_spec) if "week_spec" in placeholders else "",
+        "role_context": _to_json(role_context) if "role_context" in placeholders else "",
+        # Placeholders for missing dependencies
+        "prior_knowledge_digest": "{}",
+        "day_summary": "",
+        "week_summary": ""
+    })
 
     return (system_content, user_content, None)  # No JSON schema (markdown output)
 
@@ -1940,6 +2260,77 @@ def task_day_guidelines(
 # DAY FIELDS PROMPT (Fields 01-03) - Metadata fields only
 # ============================================================================
 
+# Pedagogical intent per day number (gold standard pattern); index 0 is the
+# fallback. Day 1 is "Discovery" here rather than _DAY_INTENT_SHORT's "Learn".
+_FIELDS_DAY_INTENTS = ("Learn", "Discovery", "Practice", "Review", "Quiz")
+
+# Static rules of the day_fields system prompt; identical for every day build
+_FIELDS_SYS_PREFIX = (
+    "Generate the THREE metadata fields for a single day lesson in a CLASSICAL LATIN curriculum:\n"
+    "1. class_name - engaging, narrative lesson title\n"
+    "2. summary - narrative 3-5 sentence overview with italicized Latin terms\n"
+    "3. grade_level - target grade range\n"
+    "\n"
+    "FIELD NUMBERING (7-field architecture):\n"
+    "- These are fields 01, 02, 03\n"
+    "- Field 04 (role_context) is generated separately\n"
+    "- Field 05 (guidelines), 06 (document), 07 (greeting) are generated separately\n\n"
+    "CRITICAL - LATIN CURRICULUM REQUIREMENTS:\n"
+    "- This is a CLASSICAL LATIN curriculum (declensions, conjugations, cases)\n"
+    "- class_name must describe LATIN content only (grammar, vocabulary, pronunciation)\n"
+    "- summary must be about LATIN learning - NOT math, science, or other subjects\n"
+    "- Topic should reference Latin grammar concepts, vocabulary themes, or language skills\n"
+    "- DO NOT use topics like 'ecosystems', 'fractions', 'biology', 'math', etc.\n\n"
+    "CLASS NAME STYLE (GOLD STANDARD PATTERN):\n"
+    "- Format: 'Latin A – Week NN Day N : Engaging Subtitle – Pedagogical Intent'\n"
+    "- Use en-dash (–) not hyphen (-)\n"
+    "- Engaging subtitle should be narrative and exciting (not 'Introduction to...')\n"
+    "- Examples from gold standard:\n"
+    "  * 'Latin A – Week 11 Day 1 : Discovery – Meet the –āre Family'\n"
+    "  * 'Latin A – Week 05 Day 2 : Practice – Building with –us Nouns'\n"
+    "  * 'Latin A – Week 03 Day 3 : Review – Mastering First Declension'\n\n"
+    "SUMMARY STYLE (GOLD STANDARD PATTERN):\n"
+    "- Write in narrative present tense (\"Sparky begins...\", \"Students now meet...\")\n"
+    "- Italicize ALL Latin words using *asterisks* (e.g., *puella*, *sum, esse*)\n"
+    "- Connect to prior knowledge and preview future lessons\n"
+    "- Include virtue and faith phrase\n"
+    "- 3-5 sentences, flowing narrative (not bullet points)\n"
+    "- Example: 'Sparky begins Week 2 by recalling *salve* from last week. Students now meet the **First Declension (–a)** nouns and chant endings showing case patterns. Familiar words such as *puella*, *rosa*, and *aqua* appear, building vocabulary foundations. The virtue **Patientia – Patience** reminds us to practice carefully. Tomorrow they'll strengthen accuracy and explore more noun forms.'\n\n"
+    "LATIN CONTENT REASONING:\n"
+    "- Read the week title and grammar_focus to identify the Latin topic\n"
+    "- Generate class_name subtitle that matches Classical Latin pedagogy\n"
+    "- CORRECT patterns: declensions, conjugations, cases, Latin vocabulary\n"
+    "- FORBIDDEN patterns: modern languages, daily routines, non-Latin subjects\n\n"
+)
+
+# Week/day-specific tail of the day_fields system prompt, filled with str.format
+_FIELDS_SYS_WEEK_TMPL = (
+    "WEEK NUMBER VALIDATION:\n"
+    "- You are generating content for WEEK {week_number} DAY {day}\n"
+    "- class_name MUST start with exactly: 'Latin A – Week {week_number:02d} Day {day} :'\n"
+    "- DO NOT use any other week number - this is Week {week_number}\n\n"
+    "INSTRUCTIONS:\n"
+    "- class_name: Format 'Latin A – Week {week_number:02d} Day {day} : [Engaging Subtitle] – {day_intent}' (≤100 chars)\n"
+    "- summary: Narrative 3-5 sentences with *italicized* Latin terms, connecting prior/future (150-300 chars)\n"
+    "- grade_level: Format as 'N-M' where N and M are grade numbers (e.g., '3-5', '6-8')\n\n"
+    "OUTPUT FORMAT:\n"
+    "Return as JSON object with these keys.\n"
+    "{{\n"
+    "  \"class_name\": \"Latin A – Week {week_number:02d} Day {day} : [Engaging Subtitle] – {day_intent}\",\n"
+    "  \"summary\": \"Narrative paragraph with *italicized* Latin terms connecting prior knowledge and future lessons.\",\n"
+    "  \"grade_level\": \"3-5\"\n"
+    "}}\n\n"
+    "SELF-CHECK:\n"
+    "✓ Does class_name start with EXACTLY 'Latin A – Week {week_number:02d} Day {day} :'?\n"
+    "✓ Does subtitle use en-dash (–) before day intent (Discovery/Practice/Review/Quiz)?\n"
+    "✓ Is subtitle engaging and narrative (not 'Introduction to...')?\n"
+    "✓ Does summary use *asterisks* for ALL Latin words?\n"
+    "✓ Is summary narrative present tense (3-5 sentences)?\n"
+    "✓ Does summary connect prior knowledge and preview tomorrow?\n"
+    "✓ Is grade_level in 'N-M' format (e.g., '3-5')?\n"
+)
+
+
 def task_day_fields(week_spec: dict, day: int) -> Tuple[str, str, Optional[Dict]]:
     """
     Generate prompts for day metadata fields (class_name, summary, grade_level).
@@ -1964,93 +2355,23 @@ def task_day_fields(week_spec: dict, day: int) -> Tuple[str, str, Optional[Dict]
     week_title = week_data["week_title"]
     grammar_focus = week_data["grammar_focus"]
 
-    # Map day number to pedagogical intent (gold standard pattern)
-    day_intents = {
-        1: "Discovery",  # or "Learn"
-        2: "Practice",
-        3: "Review",
-        4: "Quiz"
-    }
-    day_intent = day_intents.get(day, "Learn")
+    day_intent = _FIELDS_DAY_INTENTS[day] if 1 <= day <= 4 else _FIELDS_DAY_INTENTS[0]
 
-    sys = (
-        "Generate the THREE metadata fields for a single day lesson in a CLASSICAL LATIN curriculum:\n"
-        "1. class_name - engaging, narrative lesson title\n"
-        "2. summary - narrative 3-5 sentence overview with italicized Latin terms\n"
-        "3. grade_level - target grade range\n"
-        "\n"
-        "FIELD NUMBERING (7-field architecture):\n"
-        "- These are fields 01, 02, 03\n"
-        "- Field 04 (role_context) is generated separately\n"
-        "- Field 05 (guidelines), 06 (document), 07 (greeting) are generated separately\n\n"
-        "CRITICAL - LATIN CURRICULUM REQUIREMENTS:\n"
-        "- This is a CLASSICAL LATIN curriculum (declensions, conjugations, cases)\n"
-        "- class_name must describe LATIN content only (grammar, vocabulary, pronunciation)\n"
-        "- summary must be about LATIN learning - NOT math, science, or other subjects\n"
-        "- Topic should reference Latin grammar concepts, vocabulary themes, or language skills\n"
-        "- DO NOT use topics like 'ecosystems', 'fractions', 'biology', 'math', etc.\n\n"
-        f"WEEK NUMBER VALIDATION:\n"
-        f"- You are generating content for WEEK {week_number} DAY {day}\n"
-        f"- class_name MUST start with exactly: 'Latin A – Week {week_number:02d} Day {day} :'\n"
-        f"- DO NOT use any other week number - this is Week {week_number}\n\n"
-        "CLASS NAME STYLE (GOLD STANDARD PATTERN):\n"
-        "- Format: 'Latin A – Week NN Day N : Engaging Subtitle – Pedagogical Intent'\n"
-        "- Use en-dash (–) not hyphen (-)\n"
-        "- Engaging subtitle should be narrative and exciting (not 'Introduction to...')\n"
-        "- Examples from gold standard:\n"
-        "  * 'Latin A – Week 11 Day 1 : Discovery – Meet the –āre Family'\n"
-        "  * 'Latin A – Week 05 Day 2 : Practice – Building with –us Nouns'\n"
-        "  * 'Latin A – Week 03 Day 3 : Review – Mastering First Declension'\n\n"
-        "SUMMARY STYLE (GOLD STANDARD PATTERN):\n"
-        "- Write in narrative present tense (\"Sparky begins...\", \"Students now meet...\")\n"
-        "- Italicize ALL Latin words using *asterisks* (e.g., *puella*, *sum, esse*)\n"
-        "- Connect to prior knowledge and preview future lessons\n"
-        "- Include virtue and faith phrase\n"
-        "- 3-5 sentences, flowing narrative (not bullet points)\n"
-        "- Example: 'Sparky begins Week 2 by recalling *salve* from last week. Students now meet the **First Declension (–a)** nouns and chant endings showing case patterns. Familiar words such as *puella*, *rosa*, and *aqua* appear, building vocabulary foundations. The virtue **Patientia – Patience** reminds us to practice carefully. Tomorrow they'll strengthen accuracy and explore more noun forms.'\n\n"
-        "LATIN CONTENT REASONING:\n"
-        "- Read the week title and grammar_focus to identify the Latin topic\n"
-        "- Generate class_name subtitle that matches Classical Latin pedagogy\n"
-        "- CORRECT patterns: declensions, conjugations, cases, Latin vocabulary\n"
-        "- FORBIDDEN patterns: modern languages, daily routines, non-Latin subjects\n\n"
-        "INSTRUCTIONS:\n"
-        f"- class_name: Format 'Latin A – Week {week_number:02d} Day {day} : [Engaging Subtitle] – {day_intent}' (≤100 chars)\n"
-        "- summary: Narrative 3-5 sentences with *italicized* Latin terms, connecting prior/future (150-300 chars)\n"
-        "- grade_level: Format as 'N-M' where N and M are grade numbers (e.g., '3-5', '6-8')\n\n"
-        "OUTPUT FORMAT:\n"
-        "Return as JSON object with these keys.\n"
-        "{\n"
-        f"  \"class_name\": \"Latin A – Week {week_number:02d} Day {day} : [Engaging Subtitle] – {day_intent}\",\n"
-        "  \"summary\": \"Narrative paragraph with *italicized* Latin terms connecting prior knowledge and future lessons.\",\n"
-        "  \"grade_level\": \"3-5\"\n"
-        "}\n\n"
-        "SELF-CHECK:\n"
-        f"✓ Does class_name start with EXACTLY 'Latin A – Week {week_number:02d} Day {day} :'?\n"
-        "✓ Does subtitle use en-dash (–) before day intent (Discovery/Practice/Review/Quiz)?\n"
-        "✓ Is subtitle engaging and narrative (not 'Introduction to...')?\n"
-        "✓ Does summary use *asterisks* for ALL Latin words?\n"
-        "✓ Is summary narrative present tense (3-5 sentences)?\n"
-        "✓ Does summary connect prior knowledge and preview tomorrow?\n"
-        "✓ Is grade_level in 'N-M' format (e.g., '3-5')?\n"
+    sys = _FIELDS_SYS_PREFIX + _FIELDS_SYS_WEEK_TMPL.format(
+        week_number=week_number, day=day, day_intent=day_intent
     )
 
-    # Use helper to extract data
-    week_data = _extract_from_week_spec(week_spec)
-
     usr = (
         f"Week metadata and objectives for Day {day}:\n\n"
         f"CRITICAL: This week is about '{week_data['grammar_focus']}'. ALL 4 days must focus on this same grammar topic.\n"
         f"Do NOT introduce new topics (verbs, other declensions, etc.). Stay on '{week_data['grammar_focus']}'.\n\n"
-        + orjson.dumps(
-            {
-                "metadata": week_data["metadata"],
-                "objectives": week_data["objectives"],
-                "grammar_focus": week_data["grammar_focus"],
-                "week_number": week_data["week_number"],
-                "day": day
-            },
-            option=orjson.OPT_INDENT_2
-        ).decode()
+        + _dumps_compact({
+            "metadata": week_data["metadata"],
+            "objectives": week_data["objectives"],
+            "grammar_focus": week_data["grammar_focus"],
+            "week_number": week_data["week_number"],
+            "day": day
+        })
     )
 
     return sys, usr, None
@@ -2061,25 +2382,8 @@ def task_day_fields(week_spec: dict, day: int) -> Tuple[str, str, Optional[Dict]
 # Depends on: role_context (04), guidelines (05)
 # ============================================================================
 
-def task_day_document(week_spec: dict, day: int, research_plan: Optional[Dict[str, Any]] = None) -> Tuple[str, str, Optional[Dict]]:
-    """
-    Generate prompts for day document_for_sparky (field 06 - 6 teacher support documents).
-
-    UPDATED FOR v1.1 ARCHITECTURE + PHASE 0 INTEGRATION:
-    - Field 06 is now a DIRECTORY with 6 .txt files (not a single JSON)
-    - Returns 6 plain-text documents for teacher support
-    - Each document serves a specific instructional purpose
-    - NOW receives PHASE 0 research findings with verified Latin vocabulary
-
-    Args:
-        week_spec: The week specification data from internal_documents/
-        day: Day number (1-4)
-        research_plan: Optional PHASE 0 research findings with verified vocabulary
-
-    Returns:
-        (system_prompt, user_prompt, json_schema_hint)
-    """
-    sys = """You are Steel, the curriculum architect for TEQUILA CLASSICAL LATIN A.
+# System prompt for task_day_document; fully static
+_DAY_DOCUMENT_SYSTEM = """You are Steel, the curriculum architect for TEQUILA CLASSICAL LATIN A.
 
 Generate 6 teacher support documents for field 06_document_for_sparky/.
 Each document is PLAIN TEXT (not JSON) and serves a specific instructional purpose.
@@ -2104,52 +2408,13 @@ REASONING CHECK before generating vocabulary_key_document:
 
 Focus on clarity, specificity, and pedagogical value for classroom teachers teaching CLASSICAL LATIN."""
 
-    # Use helper to extract data (supports v1.0, v1.1, custom formats)
-    week_data = _extract_from_week_spec(week_spec)
-
-    usr = f"""Generate 6 teacher support documents for Week {week_data['week_number']} Day {day}.
-
-## Week Context
-Grammar Focus: {week_data['grammar_focus']}
-Vocabulary: {[v.get('word', v) if isinstance(v, dict) else v for v in week_data['vocabulary'][:7]]}
-Virtue: {week_data['virtue_focus']}
-Faith Phrase: {week_data['faith_phrase']}"""
-
-    # INJECT PHASE 0 RESEARCH if available
-    if research_plan:
-        vocab_plan = research_plan.get("04_vocabulary_plan", {})
-        if vocab_plan:
-            new_words = [w.get('word', '') for w in vocab_plan.get('new_latin_words', [])]
-            recycled_words = [w.get('word', '') for w in vocab_plan.get('recycled_latin_words', [])]
-
-            usr += f"""
-
-## PHASE 0 RESEARCH - VERIFIED LATIN VOCABULARY
-
-The following vocabulary was researched and verified as Classical Latin by a reasoning model.
-**YOU MUST USE THESE WORDS EXACTLY** in the vocabulary_key_document:
-
-NEW LATIN WORDS (verified Classical Latin):
-{', '.join(new_words)}
-
-RECYCLED WORDS (spiral review):
-{', '.join(recycled_words)}
-
-CRITICAL: Do NOT generate different vocabulary. Use the researched words above.
-These words were specifically chosen to match the grammar topic and verified as Classical Latin."""
-
-    usr += """
-
-## CRITICAL REQUIREMENTS - READ BEFORE GENERATING
-This is a CLASSICAL LATIN curriculum. You MUST:
-1. Use ONLY Classical Latin vocabulary (puella, amo, salve, pax, Deus, aqua, terra, sum, es, est).
-2. NEVER use Spanish words (levantarse, ducharse, vestirse, cepillarse).
-3. NEVER use words ending in -arse, -erse, -irse (these are Spanish infinitives, NOT Latin).
-4. NEVER use reflexive verbs, articles (el/la), or modern Romance language words.
-5. Use ONLY Latin grammar topics (declensions, conjugations, cases, Latin verb forms).
-6. ALL vocabulary in vocabulary_key_document MUST be Classical Latin words.
-7. ALL chants in chant_chart_document MUST be Latin paradigms.
-8. Read the Grammar Focus to determine appropriate LATIN vocabulary for this week.
+# Invariant instructions leading the task_day_document user prompt (kept
+# first so every day build shares the same prefix)
+_DAY_DOCUMENT_INSTRUCTIONS = """## CRITICAL REQUIREMENTS - READ BEFORE GENERATING
+Follow the CLASSICAL LATIN rules in the system message: Classical Latin vocabulary and grammar only; no Spanish, reflexive verbs, or modern Romance language words. You MUST also:
+1. Use ONLY Classical Latin words in vocabulary_key_document.
+2. Use ONLY Latin paradigms in chant_chart_document.
+3. Read the Grammar Focus to determine appropriate LATIN vocabulary for this week.
 
 ## Task
 Return a JSON object with these 6 keys (each value is plain text, NOT nested JSON):
@@ -2195,6 +2460,80 @@ FINAL CHECK before returning:
 ✓ Do all documents reference LATIN grammar and vocabulary?
 """
 
+# Per-day week context and PHASE 0 vocabulary sections, filled with str.format
+_DAY_DOCUMENT_WEEK_CONTEXT = """
+## Week Context
+Generate 6 teacher support documents for Week {week_number} Day {day}.
+Grammar Focus: {grammar_focus}
+Vocabulary: {vocabulary}
+Virtue: {virtue_focus}
+Faith Phrase: {faith_phrase}"""
+
+_DAY_DOCUMENT_RESEARCH_SECTION = """
+
+## PHASE 0 RESEARCH - VERIFIED LATIN VOCABULARY
+
+The following vocabulary was researched and verified as Classical Latin by a reasoning model.
+**YOU MUST USE THESE WORDS EXACTLY** in the vocabulary_key_document:
+
+NEW LATIN WORDS (verified Classical Latin):
+{new_words}
+
+RECYCLED WORDS (spiral review):
+{recycled_words}
+
+CRITICAL: Do NOT generate different vocabulary. Use the researched words above.
+These words were specifically chosen to match the grammar topic and verified as Classical Latin."""
+
+
+def task_day_document(week_spec: dict, day: int, research_plan: Optional[Dict[str, Any]] = None) -> Tuple[str, str, Optional[Dict]]:
+    """
+    Generate prompts for day document_for_sparky (field 06 - 6 teacher support documents).
+
+    UPDATED FOR v1.1 ARCHITECTURE + PHASE 0 INTEGRATION:
+    - Field 06 is now a DIRECTORY with 6 .txt files (not a single JSON)
+    - Returns 6 plain-text documents for teacher support
+    - Each document serves a specific instructional purpose
+    - NOW receives PHASE 0 research findings with verified Latin vocabulary
+
+    Args:
+        week_spec: The week specification data from internal_documents/
+        day: Day number (1-4)
+        research_plan: Optional PHASE 0 research findings with verified vocabulary
+
+    Returns:
+        (system_prompt, user_prompt, json_schema_hint)
+    """
+    sys = _DAY_DOCUMENT_SYSTEM
+
+    # Use helper to extract data (supports v1.0, v1.1, custom formats)
+    week_data = _extract_from_week_spec(week_spec)
+
+    # Static instructions first and per-week context last, so every day build
+    # shares the same leading bytes (provider prefix caching)
+    parts = [
+        _DAY_DOCUMENT_INSTRUCTIONS,
+        _DAY_DOCUMENT_WEEK_CONTEXT.format(
+            week_number=week_data['week_number'],
+            day=day,
+            grammar_focus=week_data['grammar_focus'],
+            vocabulary=[v.get('word', v) if isinstance(v, dict) else v for v in week_data['vocabulary'][:7]],
+            virtue_focus=week_data['virtue_focus'],
+            faith_phrase=week_data['faith_phrase']
+        )
+    ]
+
+    # INJECT PHASE 0 RESEARCH if available
+    if research_plan:
+        vocab_plan = research_plan.get("04_vocabulary_plan", {})
+        if vocab_plan:
+            parts.append(_DAY_DOCUMENT_RESEARCH_SECTION.format(
+                new_words=', '.join(w.get('word', '') for w in vocab_plan.get('new_latin_words', [])),
+                recycled_words=', '.join(w.get('word', '') for w in vocab_plan.get('recycled_latin_words', []))
+            ))
+
+    usr = "".join(parts)
+
     # Simple schema to ensure 6 required keys are present
     schema = {
         "type": "object",
@@ -2251,10 +2590,11 @@ def task_day_greeting(
     """
     # Load prompt from JSON library
     prompt_spec = _load_prompt_json("day/greeting.json")
+    placeholders = prompt_spec["_placeholders"]
 
     # Extract system and user prompts from JSON
-    system_content = prompt_spec["messages"][0]["content_template"]
-    user_template = "\n".join(prompt_spec["messages"][1]["content_template"])
+    system_content = prompt_spec["_system"]
+    user_template = prompt_spec["_user_template"]
 
     # Handle missing role_context (fallback)
     if not role_context:
@@ -2268,32 +2608,32 @@ def task_day_greeting(
     metadata = week_spec.get("01_metadata.json", {})
     week_number = metadata.get("week", metadata.get("week_number", 1))
 
-    # Build user prompt with interpolations
-    user_content = user_template.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day))
-    user_content = user_content.replace("{{class_name}}", f"Week {week_number} Day {day}")
-    user_content = user_content.replace("{{grade_level}}", "Grade 3 (Grammar Stage, U.S.)")
-
-    # Replace week_spec attributes
-    user_content = user_content.replace("{{week_spec.virtue_focus}}", metadata.get("virtue_focus", ""))
-    user_content = user_content.replace("{{week_spec.faith_phrase}}", metadata.get("faith_phrase", ""))
-
-    # Serialize role_context and document for context
-    role_context_json = json.dumps(role_context, indent=2)
-    user_content = user_content.replace("{{role_context}}", role_context_json)
+    values = {
+        "week_number": str(week_number),
+        "day_number": str(day),
+        "class_name": f"Week {week_number} Day {day}",
+        "grade_level": "Grade 3 (Grammar Stage, U.S.)",
+        # week_spec attributes
+        "week_spec.virtue_focus": metadata.get("virtue_focus", ""),
+        "week_spec.faith_phrase": metadata.get("faith_phrase", ""),
+        # Serialize role_context for context (only if the template embeds it)
+        "role_context": _to_json(role_context) if "role_context" in placeholders else "",
+        "day_document.lesson_steps": ""
+    }
 
-    if document:
+    if document and "day_document.lesson_steps" in placeholders:
         lesson_steps = document.get("lesson_flow", document.get("lesson_steps", ""))
         if isinstance(lesson_steps, dict):
-            lesson_steps = json.dumps(lesson_steps)
+            lesson_steps = _dumps_compact(lesson_steps)
         elif isinstance(lesson_steps, list):
             lesson_steps = "\n".join(f"- {step}" for step in lesson_steps)
-        user_content = user_content.replace("{{day_document.lesson_steps}}", str(lesson_steps))
-    else:
-        user_content = user_content.replace("{{day_document.lesson_steps}}", "")
+        values["day_document.lesson_steps"] = str(lesson_steps)
+
+    # Build user prompt with interpolations
+    user_content = _render_template(user_template, values)
 
     # Extract JSON schema from output_contract (greeting returns JSON with greeting_text key)
-    schema = prompt_spec["output_contract"]["schema"]
+    schema = _spec_schema(prompt_spec)
 
     return (system_content, user_content, schema)
 
@@ -2309,7 +2649,7 @@ def task_schema_selfcheck(
     field_content: str,
     expected_schema: Dict[str, Any],
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate schema self-validation report for a single field.
 
@@ -2327,32 +2667,21 @@ def task_schema_selfcheck(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with subject, summary, errors, warnings, status
     """
     prompt_spec = _load_prompt_json("validation/schema_selfcheck.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_root}}", project_root)
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_id}}", day_id)
-    user_content = user_content.replace("{{field_name}}", field_name)
-    user_content = user_content.replace("{{field_content}}", field_content)
-
-    schema_json = json.dumps(expected_schema, indent=2)
-    user_content = user_content.replace("{{expected_schema}}", schema_json)
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "project_root": project_root,
+        "week_number": str(week_number),
+        "day_id": day_id,
+        "field_name": field_name,
+        "field_content": field_content,
+        "expected_schema": _dumps_compact(expected_schema)
+    })
 
 
 # ============================================================================
@@ -2364,7 +2693,7 @@ def task_pedagogical_selfcheck(
     week_spec: Dict[str, Any],
     day_bundles: Dict[str, Dict[str, Any]],
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate pedagogical QA report for week bundle.
 
@@ -2383,33 +2712,19 @@ def task_pedagogical_selfcheck(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         Markdown report with rule results, day-by-day checklist
     """
     prompt_spec = _load_prompt_json("validation/pedagogical_selfcheck.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{project_root}}", project_root)
-
-    week_spec_json = json.dumps(week_spec, indent=2)
-    user_content = user_content.replace("{{week_spec}}", week_spec_json)
-
-    pedagogical_rules = prompt_spec["inputs"]["pedagogical_rules"]
-    rules_json = json.dumps(pedagogical_rules, indent=2)
-    user_content = user_content.replace("{{pedagogical_rules}}", rules_json)
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "week_number": str(week_number),
+        "project_root": project_root,
+        "week_spec": _to_json(week_spec),
+        "pedagogical_rules": _dumps_compact(prompt_spec["inputs"]["pedagogical_rules"])
+    })
 
 
 # ============================================================================
@@ -2419,10 +2734,10 @@ def task_pedagogical_selfcheck(
 def task_spiral_enforcement(
     week_number: int,
     day_id: str,
-    day_document: Dict[str, Any],
-    prior_knowledge_digest: Dict[str, Any],
+    day_document: Union[Dict[str, Any], str],
+    prior_knowledge_digest: Union[Dict[str, Any], str],
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate spiral enforcement report with patches.
 
@@ -2434,42 +2749,26 @@ def task_spiral_enforcement(
     Args:
         week_number: Week number (1-35)
         day_id: Day identifier (Day1, Day2, Day3, Day4)
-        day_document: DayDocument from prompt_for_day_document
-        prior_knowledge_digest: Available spiral content
+        day_document: DayDocument from prompt_for_day_document (dict or JSON string)
+        prior_knowledge_digest: Available spiral content (dict or JSON string)
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with spiral_metrics, changes, patch_json, corrected_document
     """
     prompt_spec = _load_prompt_json("enforcement/spiral_enforcement.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_root}}", project_root)
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_id}}", day_id)
-
-    day_doc_json = json.dumps(day_document, indent=2)
-    user_content = user_content.replace("{{day_document}}", day_doc_json)
-
-    digest_json = json.dumps(prior_knowledge_digest, indent=2)
-    user_content = user_content.replace("{{prior_knowledge_digest}}", digest_json)
-
-    spiral_policy = prompt_spec["inputs"]["spiral_policy"]
-    policy_json = json.dumps(spiral_policy, indent=2)
-    user_content = user_content.replace("{{spiral_policy}}", policy_json)
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "project_root": project_root,
+        "week_number": str(week_number),
+        "day_id": day_id,
+        "day_document": _maybe_dumps(day_document),
+        "prior_knowledge_digest": _maybe_dumps(prior_knowledge_digest),
+        "spiral_policy": _dumps_payload(prompt_spec["inputs"]["spiral_policy"])
+    })
 
 
 # ============================================================================
@@ -2482,7 +2781,7 @@ def task_virtue_alignment(
     week_spec: Dict[str, Any],
     day_bundle: Dict[str, Any],
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate virtue/faith alignment audit for a single day.
 
@@ -2499,40 +2798,25 @@ def task_virtue_alignment(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         Markdown report + JSON metadata with alignment summary and patches
     """
     prompt_spec = _load_prompt_json("validation/virtue_alignment.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_root}}", project_root)
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_id}}", day_id)
-
     # Extract virtue and faith from week_spec
-    virtue = week_spec.get("virtue_focus", week_spec.get("virtue", "N/A"))
-    faith_phrase = week_spec.get("faith_phrase", "N/A")
-    user_content = user_content.replace("{{week_spec.virtue}}", virtue)
-    user_content = user_content.replace("{{week_spec.faith_phrase}}", faith_phrase)
+    virtue, faith_phrase = _extract_virtue_faith(week_spec)
 
-    day_bundle_json = json.dumps(day_bundle, indent=2)
-    user_content = user_content.replace("{{day_bundle}}", day_bundle_json)
-
-    alignment_rules = prompt_spec["inputs"]["alignment_rules"]
-    rules_json = json.dumps(alignment_rules, indent=2)
-    user_content = user_content.replace("{{alignment_rules}}", rules_json)
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "project_root": project_root,
+        "week_number": str(week_number),
+        "day_id": day_id,
+        "week_spec.virtue": virtue,
+        "week_spec.faith_phrase": faith_phrase,
+        "day_bundle": _dumps_payload(day_bundle),
+        "alignment_rules": _dumps_payload(prompt_spec["inputs"]["alignment_rules"])
+    })
 
 
 # ============================================================================
@@ -2545,7 +2829,7 @@ def task_chain_context_builder(
     token_budget: int = 6000,
     include_assets: bool = False,
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate compact context bundle for generation runs.
 
@@ -2567,29 +2851,20 @@ def task_chain_context_builder(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with project_info, week_spec, prior_knowledge, manifest, day_files, provenance, size
     """
     prompt_spec = _load_prompt_json("meta/chain_context_builder.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_root}}", project_root)
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{day_number}}", str(day_number))
-    user_content = user_content.replace("{{token_budget}}", str(token_budget))
-    user_content = user_content.replace("{{include_assets}}", str(include_assets).lower())
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "project_root": project_root,
+        "week_number": str(week_number),
+        "day_number": str(day_number),
+        "token_budget": str(token_budget),
+        "include_assets": str(include_assets).lower()
+    })
 
 
 # ============================================================================
@@ -2597,10 +2872,10 @@ def task_chain_context_builder(
 # ============================================================================
 
 def task_llm_repair_cycle(
-    validation_report: Dict[str, Any],
+    validation_report: Union[Dict[str, Any], str],
     max_iterations: int = 3,
     risk_mode: str = "conservative"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate automated repair cycle plan from validation findings.
 
@@ -2609,31 +2884,30 @@ def task_llm_repair_cycle(
     Continues until gate is ok/warn or max_iterations exhausted.
 
     Args:
-        validation_report: Validation findings from prompt_for_schema_validation
+        validation_report: Validation findings from prompt_for_schema_validation (dict or JSON string)
         max_iterations: Maximum repair iterations (default: 3)
         risk_mode: Risk tolerance - 'conservative', 'moderate', or 'aggressive'
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with plan, ordered_patches, risk_notes, expected_outcome
     """
     prompt_spec = _load_prompt_json("meta/llm_repair_cycle.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
+    # Validation report is embedded ahead of the template; joined in one
+    # allocation since the report can be large
+    user_content = "".join((
+        "## Validation Report\n```json\n",
+        _maybe_dumps(validation_report),
+        "\n```\n\n",
+        prompt_spec["_user_template"]
+    ))
 
-    # Validation report is embedded in the prompt
-    validation_json = json.dumps(validation_report, indent=2)
-    user_content = f"## Validation Report\n```json\n{validation_json}\n```\n\n" + user_content
+    system_content = prompt_spec["_system"]
 
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
+    config = _spec_config(prompt_spec, include_model=True)
 
     return (system_content, user_content, config)
 
@@ -2643,11 +2917,11 @@ def task_llm_repair_cycle(
 # ============================================================================
 
 def task_cost_explanation(
-    generation_logs: list,
+    generation_logs: Union[list, str],
     time_window: str = "all",
     grouping: str = "by_week",
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate cost analysis report from generation logs.
 
@@ -2656,36 +2930,25 @@ def task_cost_explanation(
     optimization suggestions to help educators manage token budgets.
 
     Args:
-        generation_logs: Array of generation run records with tokens, model, cost
+        generation_logs: Array of generation run records with tokens, model, cost (or JSON string)
         time_window: Time filter - 'last_week', 'last_month', or 'all' (default: 'all')
         grouping: Grouping dimension - 'by_week', 'by_day', 'by_model', or 'by_operation'
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         Markdown report with executive summary, cost breakdown, top operations, optimizations, JSON metadata
     """
     prompt_spec = _load_prompt_json("meta/cost_explanation.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-
-    # Serialize generation logs
-    logs_json = json.dumps(generation_logs, indent=2)
-    user_content = user_content.replace("{{generation_logs}}", logs_json)
-    user_content = user_content.replace("{{time_window}}", time_window)
-    user_content = user_content.replace("{{grouping}}", grouping)
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        # Serialize generation logs
+        "generation_logs": _maybe_dumps(generation_logs),
+        "time_window": time_window,
+        "grouping": grouping
+    })
 
 
 # ============================================================================
@@ -2698,7 +2961,7 @@ def task_quiz_packet(
     day4_document: Dict[str, Any],
     guidelines: Optional[str] = None,
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate weekly quiz packet for Day 4 assessment.
 
@@ -2718,61 +2981,36 @@ def task_quiz_packet(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with quiz_markdown and answer_key_min array
     """
     prompt_spec = _load_prompt_json("assessment/quiz_packet.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-
     # Extract virtue and faith from week_spec
-    virtue_focus = week_spec.get("virtue_focus", week_spec.get("virtue", "N/A"))
-    faith_phrase = week_spec.get("faith_phrase", "N/A")
-    user_content = user_content.replace("{{week_spec.virtue_focus}}", virtue_focus)
-    user_content = user_content.replace("{{week_spec.faith_phrase}}", faith_phrase)
-
-    # Replace total points
-    total_points = prompt_spec["inputs"]["format_requirements"]["total_points"]
-    user_content = user_content.replace("{{format_requirements.total_points}}", str(total_points))
-
-    # Serialize week spec (condensed)
-    week_spec_json = json.dumps(week_spec, indent=2)
-    if len(week_spec_json) > 1500:
-        week_spec_excerpt = week_spec_json[:1500] + "\n... (truncated)"
-    else:
-        week_spec_excerpt = week_spec_json
-    user_content = user_content.replace("{{week_spec}}", week_spec_excerpt)
-
-    # Serialize day4 document
-    day4_json = json.dumps(day4_document, indent=2)
-    if len(day4_json) > 1500:
-        day4_excerpt = day4_json[:1500] + "\n... (truncated)"
-    else:
-        day4_excerpt = day4_json
-    user_content = user_content.replace("{{day4_document}}", day4_excerpt)
+    virtue_focus, faith_phrase = _extract_virtue_faith(week_spec)
 
     # Include guidelines if provided
     if guidelines:
         if len(guidelines) > 1000:
-            guidelines_excerpt = guidelines[:1000] + "\n... (truncated)"
+            guidelines_excerpt = guidelines[:1000] + _TRUNCATED_MARKER
         else:
             guidelines_excerpt = guidelines
-        user_content = user_content.replace("{{guidelines}}", guidelines_excerpt)
     else:
-        user_content = user_content.replace("{{guidelines}}", "[Load from Day 4 guidelines]")
+        guidelines_excerpt = "[Load from Day 4 guidelines]"
 
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "week_number": str(week_number),
+        "week_spec.virtue_focus": virtue_focus,
+        "week_spec.faith_phrase": faith_phrase,
+        "format_requirements.total_points": str(prompt_spec["inputs"]["format_requirements"]["total_points"]),
+        # Serialize week spec (condensed)
+        "week_spec": _dumps_truncated(week_spec, 1500),
+        # Serialize day4 document (condensed)
+        "day4_document": _dumps_truncated(day4_document, 1500),
+        "guidelines": guidelines_excerpt
+    })
 
 
 # ============================================================================
@@ -2784,7 +3022,7 @@ def task_teacher_key(
     quiz_markdown: str,
     answer_key_min: list,
     week_spec: Dict[str, Any]
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate detailed teacher answer key for weekly quiz.
 
@@ -2801,38 +3039,23 @@ def task_teacher_key(
         week_spec: Week specification data
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         Markdown with title, overview, question-by-question answers, chant references, virtue samples
     """
     prompt_spec = _load_prompt_json("assessment/teacher_key.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-
     # Extract virtue and faith from week_spec
-    virtue_focus = week_spec.get("virtue_focus", week_spec.get("virtue", "N/A"))
-    faith_phrase = week_spec.get("faith_phrase", "N/A")
-    user_content = user_content.replace("{{week_spec.virtue_focus}}", virtue_focus)
-    user_content = user_content.replace("{{week_spec.faith_phrase}}", faith_phrase)
-
-    # Include quiz markdown
-    user_content = user_content.replace("{{quiz_markdown}}", quiz_markdown)
-
-    # Serialize answer key
-    answer_key_json = json.dumps(answer_key_min, indent=2)
-    user_content = user_content.replace("{{answer_key_min}}", answer_key_json)
-
-    system_content = prompt_spec["messages"][0]["content_template"]
+    virtue_focus, faith_phrase = _extract_virtue_faith(week_spec)
 
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "week_number": str(week_number),
+        "week_spec.virtue_focus": virtue_focus,
+        "week_spec.faith_phrase": faith_phrase,
+        "quiz_markdown": quiz_markdown,
+        "answer_key_min": _dumps_payload(answer_key_min)
+    })
 
 
 # ============================================================================
@@ -2843,7 +3066,7 @@ def task_export_zip_manifest(
     week_number: int,
     include_assets: bool = True,
     project_root: str = "curriculum/LatinA"
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate export manifest for week ZIP bundle.
 
@@ -2860,39 +3083,22 @@ def task_export_zip_manifest(
         project_root: Root path for curriculum
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with week_info, files array, provenance, counts
     """
     prompt_spec = _load_prompt_json("export/export_zip_manifest.json")
+    inputs = prompt_spec["inputs"]
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-    user_content = user_content.replace("{{project_root}}", project_root)
-    user_content = user_content.replace("{{week_number}}", str(week_number))
-    user_content = user_content.replace("{{include_assets}}", str(include_assets).lower())
-
-    # Serialize file structure expectation
-    file_structure = prompt_spec["inputs"]["file_structure_expectation"]
-    file_structure_json = json.dumps(file_structure, indent=2)
-    user_content = user_content.replace("{{file_structure_expectation}}", file_structure_json)
-
-    # Replace metadata rules
-    metadata_rules = prompt_spec["inputs"]["metadata_rules"]
-    user_content = user_content.replace(
-        "{{metadata_rules.checksum_algorithm}}",
-        metadata_rules["checksum_algorithm"]
-    )
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "project_root": project_root,
+        "week_number": str(week_number),
+        "include_assets": str(include_assets).lower(),
+        # Serialize file structure expectation
+        "file_structure_expectation": _dumps_payload(inputs["file_structure_expectation"]),
+        "metadata_rules.checksum_algorithm": inputs["metadata_rules"]["checksum_algorithm"]
+    })
 
 
 # ============================================================================
@@ -2900,10 +3106,10 @@ def task_export_zip_manifest(
 # ============================================================================
 
 def task_error_explanation(
-    error_context: Dict[str, Any],
+    error_context: Union[Dict[str, Any], str],
     raw_error_text: str,
-    recent_findings: Optional[list] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+    recent_findings: Optional[Union[list, str]] = None
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate actionable error explanation with minimal-diff fixes.
 
@@ -2915,43 +3121,23 @@ def task_error_explanation(
     - Preventive guardrails (schema hints, tests, CI)
 
     Args:
-        error_context: Dict with component, week_number, day_number, file_path
+        error_context: Dict (or JSON string) with component, week_number, day_number, file_path
         raw_error_text: Raw traceback or error message
-        recent_findings: Optional list of validation findings
+        recent_findings: Optional list (or JSON string) of validation findings
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with diagnosis, causes, minimal_fix, verify, guardrails
     """
     prompt_spec = _load_prompt_json("support/error_explanation.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-
-    # Serialize error context
-    error_context_json = json.dumps(error_context, indent=2)
-    user_content = user_content.replace("{{error_context}}", error_context_json)
-
-    # Include raw error text
-    user_content = user_content.replace("{{raw_error_text}}", raw_error_text)
-
-    # Serialize recent findings
-    if recent_findings:
-        findings_json = json.dumps(recent_findings, indent=2)
-        user_content = user_content.replace("{{recent_findings}}", findings_json)
-    else:
-        user_content = user_content.replace("{{recent_findings}}", "[]")
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        "error_context": _maybe_dumps(error_context),
+        "raw_error_text": raw_error_text,
+        "recent_findings": _maybe_dumps(recent_findings) if recent_findings else "[]"
+    })
 
 
 # ============================================================================
@@ -2969,7 +3155,7 @@ def task_api_docstring(
     raises: Optional[list] = None,
     examples: Optional[list] = None,
     notes: Optional[list] = None
-) -> Tuple[str, str, Dict[str, Any]]:
+) -> Tuple[str, str, Mapping[str, Any]]:
     """
     Generate Python docstring in Google or NumPy style.
 
@@ -2994,53 +3180,67 @@ def task_api_docstring(
         notes: Optional list of note strings
 
     Returns:
-        (system_prompt, user_prompt, config_dict)
+        (system_prompt, user_prompt, config)
 
     Output:
         JSON with single key 'docstring' containing formatted docstring
     """
     prompt_spec = _load_prompt_json("support/api_docstring.json")
 
-    user_content = "\n".join(prompt_spec["messages"][1]["content_template"])
-
-    # Replace scalar values
-    user_content = user_content.replace("{{doc_style}}", doc_style)
-    user_content = user_content.replace("{{module_path}}", module_path)
-    user_content = user_content.replace("{{symbol_name}}", symbol_name)
-    user_content = user_content.replace("{{signature}}", signature)
-    user_content = user_content.replace("{{summary}}", summary)
-
-    # Serialize lists/dicts
-    params_json = json.dumps(params, indent=2)
-    user_content = user_content.replace("{{params}}", params_json)
-
-    returns_json = json.dumps(returns, indent=2)
-    user_content = user_content.replace("{{returns}}", returns_json)
-
-    if raises:
-        raises_json = json.dumps(raises, indent=2)
-        user_content = user_content.replace("{{raises}}", raises_json)
-    else:
-        user_content = user_content.replace("{{raises}}", "[]")
-
-    if examples:
-        examples_json = json.dumps(examples, indent=2)
-        user_content = user_content.replace("{{examples}}", examples_json)
-    else:
-        user_content = user_content.replace("{{examples}}", "[]")
-
-    if notes:
-        notes_json = json.dumps(notes, indent=2)
-        user_content = user_content.replace("{{notes}}", notes_json)
-    else:
-        user_content = user_content.replace("{{notes}}", "[]")
-
-    system_content = prompt_spec["messages"][0]["content_template"]
-
-    config = {
-        "temperature": prompt_spec["model_preferences"]["temperature"],
-        "max_tokens": prompt_spec["model_preferences"]["max_tokens"],
-        "model": prompt_spec["model_preferences"]["model"]
-    }
-
-    return (system_content, user_content, config)
+    return _run_task(prompt_spec, {
+        # Scalar values
+        "doc_style": doc_style,
+        "module_path": module_path,
+        "symbol_name": symbol_name,
+        "signature": signature,
+        "summary": summary,
+        # Serialized lists/dicts
+        "params": _dumps_payload(params),
+        "returns": _dumps_payload(returns),
+        "raises": _dumps_payload(raises or []),
+        "examples": _dumps_payload(examples or []),
+        "notes": _dumps_payload(notes or [])
+    })
+
+
+# ============================================================================
+# PROMPT SPEC PRELOAD - Parse the pipeline and QA/export specs at import time
+# ============================================================================
+
+_KNOWN_PROMPT_SPECS = (
+    "week/week_spec.json",
+    "week/week_summary.json",
+    "day/class_name.json",
+    "day/day_summary.json",
+    "day/grade_level.json",
+    "digest/prior_knowledge_digest.json",
+    # QA, export and support tasks
+    "enforcement/spiral_enforcement.json",
+    "validation/virtue_alignment.json",
+    "meta/chain_context_builder.json",
+    "meta/llm_repair_cycle.json",
+    "meta/cost_explanation.json",
+    "assessment/quiz_packet.json",
+    "assessment/teacher_key.json",
+    "export/export_zip_manifest.json",
+    "support/error_explanation.json",
+    "support/api_docstring.json"
+)
+
+
+def _preload_prompt_specs() -> None:
+    """
+    Warm the _load_prompt_json cache for the specs used on every week/day run
+    and by the QA/export tasks, so no task pays a first-call parse.
+
+    Missing or unreadable specs are skipped so a partial install still
+    imports; the owning task then loads (and reports errors) lazily.
+    """
+    for filename in _KNOWN_PROMPT_SPECS:
+        try:
+            _load_prompt_json(filename)
+        except (FileNotFoundError, ValueError):
+            continue
+
+
+_preload_prompt_specs()